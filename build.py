@@ -1,10 +1,25 @@
 """Build script for creating executables on all platforms."""
 
+import hashlib
+import os
 import platform
+import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Inputs that affect the PyInstaller bundles; any change invalidates the cache
+SOURCE_DIRS = ["ollama_image_analyzer", "prompts"]
+SOURCE_FILES = [
+    "ollama_image_analyzer_gui.spec",
+    "ollama_image_analyzer_cli.spec",
+    "pyproject.toml",
+    "requirements.txt",
+    "poetry.lock",
+]
+
 
 def run_command(cmd: list[str], description: str) -> bool:
     """Run a command and return success status."""
@@ -21,6 +36,107 @@ def run_command(cmd: list[str], description: str) -> bool:
         return False
 
 
+def _source_hash() -> str:
+    """Fingerprint all build inputs plus the interpreter/PyInstaller versions."""
+    import PyInstaller
+
+    digest = hashlib.sha256()
+    digest.update(f"{sys.version}|{platform.platform()}|{PyInstaller.__version__}".encode())
+
+    paths: list[str] = [f for f in SOURCE_FILES if os.path.isfile(f)]
+    for source_dir in SOURCE_DIRS:
+        for dirpath, dirnames, filenames in os.walk(source_dir):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            paths.extend(
+                os.path.join(dirpath, name) for name in filenames if not name.endswith(".pyc")
+            )
+
+    for path in sorted(paths):
+        digest.update(Path(path).as_posix().encode())
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def build_target(spec: str, description: str, source_hash: str) -> bool:
+    """Build a spec with PyInstaller, reusing a cached dist/ output when inputs are unchanged."""
+    from platformdirs import user_cache_dir
+
+    cache_dir = (
+        Path(user_cache_dir("ollama-image-analyzer-build"))
+        / f"{Path(spec).stem}-{source_hash[:16]}"
+    )
+    dist_dir = Path("dist")
+
+    if cache_dir.is_dir():
+        dist_dir.mkdir(exist_ok=True)
+        for item in cache_dir.iterdir():
+            # Replace the entry outright so files from an older build don't linger
+            target = dist_dir / item.name
+            _remove_entry(target)
+            _copy_entry(item, target)
+        print(f"\n✓ {description} restored from cache ({cache_dir})")
+        return True
+
+    started = time.time()
+    if not run_command([sys.executable, "-m", "PyInstaller", spec], description):
+        return False
+
+    # Snapshot the dist/ entries this build produced into a temporary sibling
+    # and move it into place once complete, so an interrupted copy is never
+    # taken for a cache hit
+    if dist_dir.exists():
+        produced = [item for item in dist_dir.iterdir() if item.stat().st_mtime >= started]
+        if produced:
+            partial_dir = cache_dir.with_name(f"{cache_dir.name}.partial-{os.getpid()}")
+            _remove_entry(partial_dir)
+            partial_dir.mkdir(parents=True)
+            try:
+                for item in produced:
+                    _copy_entry(item, partial_dir / item.name)
+                os.replace(partial_dir, cache_dir)
+            except OSError as e:
+                # Not fatal: the build itself succeeded, it just isn't cached
+                print(f"\n⚠ Could not cache {description}: {e}")
+            finally:
+                _remove_entry(partial_dir)
+    return True
+
+
+def _copy_entry(src: Path, dst: Path) -> None:
+    """Copy a file or directory tree, keeping symlinks (e.g. in macOS bundles) as links."""
+    if src.is_dir() and not src.is_symlink():
+        shutil.copytree(src, dst, symlinks=True)
+    else:
+        shutil.copy2(src, dst, follow_symlinks=False)
+
+
+def _remove_entry(path: Path) -> None:
+    """Delete a file, symlink or directory tree if it exists."""
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+def _tree_size(root: str | os.PathLike[str]) -> int:
+    """Return the total size in bytes of all files under root."""
+    total = 0
+    with os.scandir(root) as entries:
+        for entry in entries:
+            # DirEntry caches type info from readdir, avoiding a stat per check
+            if entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                total += _tree_size(entry.path)
+    return total
+
+
+def _item_size(item: Path) -> int:
+    """Return the size in bytes of a dist/ entry (file or directory tree)."""
+    return _tree_size(item) if item.is_dir() else item.stat().st_size
+
+
 def main() -> int:
     """Main build script."""
     print("\n" + "="*60)
@@ -52,17 +168,20 @@ def main() -> int:
     build_cli = choice in ["2", "3"]
     
     success = True
+    source_hash = _source_hash()
     
     if build_gui:
-        success = run_command(
-            [sys.executable, "-m", "PyInstaller", "ollama_image_analyzer_gui.spec"],
-            "Building GUI Application"
+        success = build_target(
+            "ollama_image_analyzer_gui.spec",
+            "Building GUI Application",
+            source_hash,
         ) and success
     
     if build_cli:
-        success = run_command(
-            [sys.executable, "-m", "PyInstaller", "ollama_image_analyzer_cli.spec"],
-            "Building CLI Application"
+        success = build_target(
+            "ollama_image_analyzer_cli.spec",
+            "Building CLI Application",
+            source_hash,
         ) and success
     
     # Summary
@@ -73,8 +192,12 @@ def main() -> int:
     dist_dir = Path("dist")
     if dist_dir.exists():
         print("\nBuilt files in dist/:")
-        for item in dist_dir.iterdir():
-            size_mb = sum(f.stat().st_size for f in item.rglob('*') if f.is_file()) / (1024*1024)
+        items = list(dist_dir.iterdir())
+        # Walk each bundle in its own thread so the stat syscalls overlap
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(items)))) as executor:
+            sizes = list(executor.map(_item_size, items))
+        for item, size_bytes in zip(items, sizes):
+            size_mb = size_bytes / (1024*1024)
             print(f"  - {item.name} ({size_mb:.1f} MB)")
     
     if success:
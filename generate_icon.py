@@ -1,20 +1,43 @@
 """Generate application icon."""
 
+import math
+
 from PIL import Image, ImageDraw
 
+
+def _gradient_lut(channel):
+    """Map radial_gradient values to one channel of the background gradient.
+
+    radial_gradient stores distance-from-center * sqrt(2); each distance is
+    mapped to the ring index of the concentric glow (0 = outer edge, 79 = inner).
+    """
+    lut = []
+    for value in range(256):
+        distance = value / math.sqrt(2)
+        lut.append(channel(min(79, int(128 - distance))) if distance <= 128 else 0)
+    return lut
+
+
 def create_icon():
     """Create a simple icon for the application."""
-    # Create a 256x256 image with transparency
+    # 256x256 with transparency (matches the radial_gradient canvas size)
     size = 256
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    # Draw a gradient background circle (dark purple/blue theme) in one pass
+    # via lookup tables over a 256x256 distance map
+    distance = Image.radial_gradient('L')
+    img = Image.merge('RGBA', [
+        distance.point(_gradient_lut(lambda i: 88 + i)),
+        distance.point(_gradient_lut(lambda i: 91 + i)),
+        distance.point(_gradient_lut(lambda i: 150 + i)),
+        distance.point(_gradient_lut(lambda i: int(255 * (1 - i / 80)))),
+    ])
+    # radial_gradient quantizes the distance, so clip to the outermost
+    # ring's ellipse to keep the rim pixels the loop never painted transparent
+    mask = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(mask).ellipse([0, 0, size, size], fill=255)
+    img = Image.composite(img, Image.new('RGBA', (size, size), (0, 0, 0, 0)), mask)
     draw = ImageDraw.Draw(img)
     
-    # Draw a gradient background circle (dark purple/blue theme)
-    for i in range(80):
-        alpha = int(255 * (1 - i / 80))
-        color = (88 + i, 91 + i, 150 + i, alpha)
-        draw.ellipse([i, i, size-i, size-i], fill=color)
-    
     # Draw main circle (camera lens style)
     draw.ellipse([40, 40, 216, 216], fill=(45, 47, 90, 255), outline=(166, 227, 161, 255), width=6)
     
@@ -32,15 +55,24 @@ def create_icon():
     img.save('ollama_image_analyzer/resources/icon.png', 'PNG')
     print("✓ Created icon.png (256x256)")
     
-    # Create smaller sizes
+    # Build a mipmap chain: LANCZOS for the first halving, then cheap 2x2 BOX
+    # halvings from the previous level. Each size is reused for PNG and ICO.
+    pyramid = {128: img.resize((128, 128), Image.Resampling.LANCZOS)}
+    for icon_size in [64, 32, 16]:
+        pyramid[icon_size] = pyramid[icon_size * 2].resize((icon_size, icon_size), Image.Resampling.BOX)
+    pyramid[48] = pyramid[64].resize((48, 48), Image.Resampling.LANCZOS)
     for icon_size in [128, 64, 32, 16]:
-        small = img.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
-        small.save(f'ollama_image_analyzer/resources/icon_{icon_size}.png', 'PNG')
+        pyramid[icon_size].save(f'ollama_image_analyzer/resources/icon_{icon_size}.png', 'PNG')
         print(f"✓ Created icon_{icon_size}.png")
     
-    # Create ICO file with multiple sizes
+    # Create ICO file with multiple sizes from the precomputed images
     ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    img.save('ollama_image_analyzer/resources/icon.ico', format='ICO', sizes=ico_sizes)
+    img.save(
+        'ollama_image_analyzer/resources/icon.ico',
+        format='ICO',
+        sizes=ico_sizes,
+        append_images=list(pyramid.values()),
+    )
     print("✓ Created icon.ico (multi-size)")
 
 if __name__ == '__main__':
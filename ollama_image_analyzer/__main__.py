@@ -9,14 +9,10 @@ from typing import NoReturn
 
 def main() -> NoReturn:
     """Main entry point - route to CLI or GUI based on arguments."""
-    # Check if we should run CLI mode
-    # CLI mode if: any arguments provided OR --cli flag
-    run_cli = len(sys.argv) > 1 or "--cli" in sys.argv
-
-    if run_cli:
-        # Remove --cli flag if present (it's just a mode selector)
-        if "--cli" in sys.argv:
-            sys.argv.remove("--cli")
+    # CLI mode if: any arguments provided (including the --cli flag)
+    if len(sys.argv) > 1:
+        # Drop the --cli flag (it's just a mode selector) in a single pass
+        sys.argv = [arg for arg in sys.argv if arg != "--cli"]
         
         # Run CLI
         from ollama_image_analyzer.cli.main import app
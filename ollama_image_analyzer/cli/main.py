@@ -4,23 +4,23 @@ Provides a powerful CLI for batch processing images with Ollama vision models.
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
-
-from ollama_image_analyzer.core import (
-    Config,
-    OllamaAnalyzer,
-    PromptManager,
-    get_config,
-)
+
+from ollama_image_analyzer import __version__
+from ollama_image_analyzer.core import get_config
 from ollama_image_analyzer.core.logging_config import setup_logging
 
+if TYPE_CHECKING:
+    from ollama_image_analyzer.core import AnalysisResult
+
+# Heavier imports (rich widgets, the Ollama client) are deferred to the
+# commands that need them so --version/config-show start quickly
+
 # Create Typer app
 app = typer.Typer(
     name="ollama-image-analyzer",
@@ -82,6 +82,13 @@ def analyze(
         "--no-overwrite",
         help="Create numbered versions (_1, _2) instead of overwriting existing files",
     ),
+    jobs: int = typer.Option(
+        4,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of images to analyze concurrently",
+    ),
 ) -> None:
     """
     Analyze one or more images using Ollama vision models.
@@ -99,7 +106,16 @@ def analyze(
         
         # Custom prompt
         ollama-image-analyzer analyze photo.jpg --prompt prompts/custom.txt
+        
+        # Analyze 8 images at a time
+        ollama-image-analyzer analyze *.jpg --jobs 8
     """
+    from rich.panel import Panel
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+    from rich.table import Table
+
+    from ollama_image_analyzer.core import OllamaAnalyzer, PromptManager
+
     # Setup logging
     log_level = logging.DEBUG if verbose else logging.WARNING if quiet else logging.INFO
     setup_logging(level=log_level, console=not quiet)
@@ -117,6 +133,7 @@ def analyze(
         host=ollama_host,
         model=ollama_model,
         timeout=config.timeout_seconds,
+        num_thread=config.num_thread,
     )
 
     # Load prompt
@@ -129,107 +146,172 @@ def analyze(
         console.print(f"[red]Error loading prompt: {e}[/red]")
         raise typer.Exit(1)
 
-    # Test connection
-    if not quiet:
-        console.print(f"[cyan]Connecting to Ollama at {ollama_host}...[/cyan]")
+    try:
+        # Test connection
+        if not quiet:
+            console.print(f"[cyan]Connecting to Ollama at {ollama_host}...[/cyan]")
     
-    if not analyzer.test_connection():
-        console.print(f"[red]Failed to connect to Ollama server at {ollama_host}[/red]")
-        console.print("[yellow]Make sure Ollama is running and the host/port are correct.[/yellow]")
-        raise typer.Exit(1)
-
-    if not quiet:
-        console.print(f"[green]✓[/green] Connected to Ollama")
-        console.print(f"[cyan]Using model:[/cyan] {ollama_model}")
-        console.print(f"[cyan]Processing {len(images)} image(s)[/cyan]\n")
-
-    # Process images
-    success_count = 0
-    error_count = 0
-    results_table = Table(title="Analysis Results" if not quiet else None, show_header=True)
-    results_table.add_column("Image", style="cyan")
-    results_table.add_column("Status", style="bold")
-    results_table.add_column("Output", style="dim")
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-        disable=quiet,
-    ) as progress:
-        task = progress.add_task("[cyan]Analyzing images...", total=len(images))
-
+        if not analyzer.test_connection():
+            console.print(f"[red]Failed to connect to Ollama server at {ollama_host}[/red]")
+            console.print("[yellow]Make sure Ollama is running and the host/port are correct.[/yellow]")
+            raise typer.Exit(1)
+
+        if not quiet:
+            console.print(f"[green]✓[/green] Connected to Ollama")
+            console.print(f"[cyan]Using model:[/cyan] {ollama_model}")
+            console.print(f"[cyan]Processing {len(images)} image(s)[/cyan]\n")
+
+        def _output_path_for(image_path: Path) -> Path:
+            if output_dir:
+                return output_dir / f"{image_path.stem}.txt"
+            return image_path.with_suffix(".txt")
+
+        def _process_one(
+            image_path: Path,
+        ) -> Tuple[Path, "AnalysisResult", Optional[Path], Optional[Exception]]:
+            """Analyze a single image and save its result (runs in a worker thread)."""
+            result = analyzer.analyze_image(image_path, analysis_prompt)
+            if not result.success:
+                return image_path, result, None, None
+            try:
+                saved_path = analyzer.save_result(
+                    result, _output_path_for(image_path), overwrite=not no_overwrite
+                )
+                return image_path, result, saved_path, None
+            except Exception as e:
+                return image_path, result, None, e
+
+        def _row_for(
+            image_path: Path,
+            result: "AnalysisResult",
+            saved_path: Optional[Path],
+            save_error: Optional[Exception],
+        ) -> Tuple[bool, Tuple[str, str, str]]:
+            """Build the results table row for a processed image, and whether it succeeded."""
+            if not result.success:
+                return False, (
+                    image_path.name,
+                    "[red]✗ Analysis failed[/red]",
+                    result.error or "Unknown error",
+                )
+            if isinstance(save_error, ValueError):
+                # Validation error
+                return False, (
+                    image_path.name,
+                    "[red]✗ Validation failed[/red]",
+                    str(save_error),
+                )
+            if save_error is not None:
+                return False, (
+                    image_path.name,
+                    "[red]✗ Save failed[/red]",
+                    str(save_error),
+                )
+            return True, (
+                image_path.name,
+                "[green]✓ Success[/green]",
+                str(saved_path.relative_to(cwd) if saved_path.is_relative_to(cwd) else saved_path),
+            )
+
+        # Process images
+        success_count = 0
+        error_count = 0
+        # (image, status, output) rows, added to the results table after the batch
+        rows: List[Tuple[str, str, str]] = []
+        cwd = Path.cwd()
+        interrupted = False
+
+        # Filter out non-image files up front so they don't count towards progress
+        supported_images: List[Path] = []
         for image_path in images:
-            # Filter out non-image files
-            if not analyzer.is_supported_image(image_path):
-                if not quiet:
-                    console.print(f"[yellow]Skipping unsupported file: {image_path.name}[/yellow]")
-                progress.advance(task)
-                continue
-            
-            # Check if output file exists when overwrite protection is enabled
-            if no_overwrite:
-                if output_dir:
-                    output_path = output_dir / f"{image_path.stem}.txt"
-                else:
-                    output_path = image_path.with_suffix(".txt")
-                
-                if output_path.exists():
+            if image_path.suffix.lower() in OllamaAnalyzer.SUPPORTED_FORMATS:
+                supported_images.append(image_path)
+            elif not quiet:
+                console.print(f"[yellow]Skipping unsupported file: {image_path.name}[/yellow]")
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            disable=quiet,
+        ) as progress:
+            task = progress.add_task("[cyan]Analyzing images...", total=len(supported_images))
+
+            # Filter out files that won't be analyzed before dispatching work
+            pending: List[Path] = []
+            for image_path in supported_images:
+                # Check if output file exists when overwrite protection is enabled
+                if no_overwrite and _output_path_for(image_path).exists():
                     if not quiet:
                         console.print(f"[yellow]Skipping {image_path.name} - output file already exists[/yellow]")
                     progress.advance(task)
                     continue
 
-            progress.update(task, description=f"[cyan]Analyzing {image_path.name}...")
-            
-            # Analyze image
-            result = analyzer.analyze_image(image_path, analysis_prompt)
-
-            if result.success:
-                # Determine output path
-                if output_dir:
-                    output_path = output_dir / f"{image_path.stem}.txt"
-                else:
-                    output_path = image_path.with_suffix(".txt")
-
-                # Save result
-                try:
-                    saved_path = analyzer.save_result(result, output_path, overwrite=not no_overwrite)
+                pending.append(image_path)
+
+            # Load the model once up front instead of on the first image, unless
+            # every image was skipped
+            if pending:
+                analyzer.warmup()
+
+            # Analyze concurrently - each request is a network round-trip to Ollama,
+            # so threads share the analyzer (and its HTTP client) safely.
+            # Only refresh the description ~50 times per batch to limit redraws
+            description_every = max(1, len(pending) // 50)
+            # Not a with block: its exit would wait for every queued image, so
+            # Ctrl-C couldn't stop the batch until all of them were analyzed
+            executor = ThreadPoolExecutor(max_workers=jobs)
+            futures: List[Future] = []
+            reported: Set[Future] = set()
+
+            def _report(future: Future) -> str:
+                """Add a finished image's row to the results; returns its file name."""
+                nonlocal success_count, error_count
+                processed = future.result()
+                succeeded, row = _row_for(*processed)
+                if succeeded:
                     success_count += 1
-                    results_table.add_row(
-                        image_path.name,
-                        "[green]✓ Success[/green]",
-                        str(saved_path.relative_to(Path.cwd()) if saved_path.is_relative_to(Path.cwd()) else saved_path)
-                    )
-                except ValueError as e:
-                    # Validation error
-                    error_count += 1
-                    results_table.add_row(
-                        image_path.name,
-                        "[red]✗ Validation failed[/red]",
-                        str(e)
-                    )
-                except Exception as e:
+                else:
                     error_count += 1
-                    results_table.add_row(
-                        image_path.name,
-                        "[red]✗ Save failed[/red]",
-                        str(e)
-                    )
-            else:
-                error_count += 1
-                results_table.add_row(
-                    image_path.name,
-                    "[red]✗ Analysis failed[/red]",
-                    result.error or "Unknown error"
-                )
+                rows.append(row)
+                reported.add(future)
+                return processed[0].name
 
-            progress.advance(task)
+            try:
+                futures.extend(executor.submit(_process_one, p) for p in pending)
+
+                for completed, future in enumerate(as_completed(futures)):
+                    image_name = _report(future)
+                    if completed % description_every == 0:
+                        progress.update(task, description=f"[cyan]Analyzed {image_name}")
+                    progress.advance(task)
+            except KeyboardInterrupt:
+                # Drop the queued images; requests already in flight finish
+                # before the client they share is closed, and are reported
+                executor.shutdown(wait=True, cancel_futures=True)
+                interrupted = True
+                for future in futures:
+                    if future not in reported and not future.cancelled() and future.exception() is None:
+                        _report(future)
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            else:
+                executor.shutdown()
+    finally:
+        analyzer.close()
 
     # Display results
     if not quiet:
+        results_table = Table(title="Analysis Results", show_header=True)
+        results_table.add_column("Image", style="cyan")
+        results_table.add_column("Status", style="bold")
+        results_table.add_column("Output", style="dim")
+        for row in rows:
+            results_table.add_row(*row)
+
         console.print()
         console.print(results_table)
         console.print()
@@ -241,6 +323,10 @@ def analyze(
         
         console.print(Panel(summary, title="Summary", border_style="cyan"))
 
+    if interrupted:
+        console.print("[yellow]Interrupted; queued images were not analyzed[/yellow]")
+        raise typer.Exit(130)
+
     # Exit with error code if any failed
     if error_count > 0:
         raise typer.Exit(1)
@@ -256,6 +342,10 @@ def models(
     ),
 ) -> None:
     """List available vision models from Ollama server."""
+    from rich.table import Table
+
+    from ollama_image_analyzer.core import OllamaAnalyzer
+
     config = get_config()
     ollama_host = host or config.ollama_host
 
@@ -297,6 +387,8 @@ def models(
 @app.command()
 def config_show() -> None:
     """Show current configuration."""
+    from rich.table import Table
+
     config = get_config()
     
     table = Table(title="Current Configuration", show_header=True)
@@ -324,7 +416,6 @@ def main(
 ) -> None:
     """Ollama Image Analyzer - Analyze images with AI vision models."""
     if version:
-        from ollama_image_analyzer import __version__
         console.print(f"Ollama Image Analyzer v{__version__}")
         raise typer.Exit(0)
     
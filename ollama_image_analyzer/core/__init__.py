@@ -1,8 +1,22 @@
 """Core functionality for Ollama Image Analyzer."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .config import Config, get_config, save_config
 from .prompt_manager import PromptManager
-from .ollama_client import OllamaAnalyzer, AnalysisResult
+
+if TYPE_CHECKING:
+    from .ollama_client import AnalysisResult, OllamaAnalyzer
+    from .result_cache import ResultCache
+
+# The Ollama client pulls in ollama/httpx/pydantic, so it is only imported
+# the first time one of its names is accessed
+_LAZY_ATTRS = {
+    "OllamaAnalyzer": ".ollama_client",
+    "AnalysisResult": ".ollama_client",
+    "ResultCache": ".result_cache",
+}
 
 __all__ = [
     "Config",
@@ -11,4 +25,15 @@ __all__ = [
     "PromptManager",
     "OllamaAnalyzer",
     "AnalysisResult",
+    "ResultCache",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily-exported names on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -6,9 +6,11 @@ for cross-platform configuration storage.
 
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+import os
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from platformdirs import user_config_dir, user_data_dir
 
@@ -16,8 +18,52 @@ from ollama_image_analyzer import PACKAGE_NAME
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson (parses/serializes UTF-8 bytes in C) when it is installed
+_json_loads: Callable[[bytes], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = lambda data: orjson.dumps(data, option=orjson.OPT_INDENT_2)  # noqa: E731
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = lambda data: json.dumps(data, indent=2).encode("utf-8")  # noqa: E731
+
+
+def _read_small_file(path: Path) -> bytes:
+    """Read a small file with one open/fstat/read/close syscall sequence.
+
+    Avoids the extra ioctl/lseek/fstat calls the buffered open() layer makes.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)  # +1 so EOF is observed in the same read
+        if len(data) > size:
+            # File grew since fstat; read the remainder
+            chunks = [data]
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=None)
+def _default_config_dir() -> Path:
+    """Resolve the platform config directory once per process."""
+    return Path(user_config_dir(PACKAGE_NAME))
+
 
-@dataclass
+@lru_cache(maxsize=None)
+def _default_data_dir() -> Path:
+    """Resolve the platform data directory once per process."""
+    return Path(user_data_dir(PACKAGE_NAME))
+
+
+@dataclass(slots=True)
 class Config:
     """Application configuration settings."""
 
@@ -38,34 +84,47 @@ class Config:
     timeout_seconds: int = 300
     save_responses: bool = True
     overwrite_existing_files: bool = True  # If False, creates numbered versions (_1, _2, etc.)
+    cache_results: bool = True  # Reuse results for unchanged images/prompt/model (size-capped)
+    # Images analyzed at once in a batch; match OLLAMA_NUM_PARALLEL on the server
+    batch_concurrency: int = field(default_factory=lambda: min(os.cpu_count() or 1, 4))
+    num_thread: int = 0  # CPU threads Ollama uses for generation; 0 = server default
     
     # Internal
-    _config_dir: Path = field(default_factory=lambda: Path(user_config_dir(PACKAGE_NAME)))
-    _data_dir: Path = field(default_factory=lambda: Path(user_data_dir(PACKAGE_NAME)))
+    _config_dir: Path = field(default_factory=_default_config_dir)
+    _data_dir: Path = field(default_factory=_default_data_dir)
 
     def __post_init__(self) -> None:
         """Ensure directories exist after initialization."""
-        self._config_dir.mkdir(parents=True, exist_ok=True)
-        self._data_dir.mkdir(parents=True, exist_ok=True)
+        # A single stat is cheaper than mkdir failing with EEXIST on every run
+        if not self._config_dir.is_dir():
+            self._config_dir.mkdir(parents=True, exist_ok=True)
+        if not self._data_dir.is_dir():
+            self._data_dir.mkdir(parents=True, exist_ok=True)
 
     @property
     def config_file(self) -> Path:
         """Get the path to the configuration file."""
         return self._config_dir / "config.json"
 
+    @property
+    def result_cache_file(self) -> Path:
+        """Get the path to the analysis result cache database."""
+        return self._data_dir / "results.sqlite3"
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary, excluding internal fields."""
-        data = asdict(self)
-        # Remove internal fields
-        data.pop("_config_dir", None)
-        data.pop("_data_dir", None)
-        return data
+        # All public fields are JSON scalars, so no recursive asdict() copy is needed
+        return {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
 
     def save(self) -> None:
         """Save configuration to disk."""
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=2)
+            # Serialize up front and write once, then swap the file into place
+            # so a crash mid-write never leaves a truncated config behind
+            payload = _json_dumps(self.to_dict())
+            tmp_file = self.config_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.config_file)
             logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -76,14 +135,8 @@ class Config:
         """Load configuration from disk, or create default if not found."""
         config = cls()
         
-        if not config.config_file.exists():
-            logger.info("No configuration file found, using defaults")
-            config.save()  # Create default config
-            return config
-        
         try:
-            with open(config.config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(_read_small_file(config.config_file))
             
             # Update config with loaded values
             for key, value in data.items():
@@ -93,6 +146,10 @@ class Config:
             logger.info(f"Configuration loaded from {config.config_file}")
             return config
             
+        except FileNotFoundError:
+            # Defaults are written lazily, the first time a setting is saved
+            logger.info("No configuration file found, using defaults")
+            return config
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}, using defaults")
             return config
@@ -1,14 +1,31 @@
 """Logging configuration for Ollama Image Analyzer."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from platformdirs import user_log_dir
 
 from ollama_image_analyzer import PACKAGE_NAME
 
+# Background listener that performs the actual console/file writes
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background logging thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(
     level: int = logging.INFO,
@@ -18,20 +35,31 @@ def setup_logging(
     """
     Configure application logging.
 
+    Records are handed to a QueueHandler and written by a QueueListener
+    thread, so logging from worker threads never blocks on console/file I/O.
+
     Args:
         level: Logging level (e.g., logging.INFO, logging.DEBUG)
         log_file: Optional path to log file. If None, uses default location.
         console: Whether to also log to console.
     """
+    global _listener
+
     # Create logger
     logger = logging.getLogger("ollama_image_analyzer")
     logger.setLevel(level)
+    # Records are fully handled here; don't repeat the work on the root logger
+    logger.propagate = False
 
-    # Clear existing handlers
+    # Clear existing handlers (and the listener from a previous setup)
+    _stop_listener()
     logger.handlers.clear()
+    handlers: List[logging.Handler] = []
 
-    # Create formatter
-    formatter = logging.Formatter(
+    # Create formatters - timestamps (localtime + strftime per record) are
+    # only worth paying for in the persistent log file
+    console_formatter = logging.Formatter("%(levelname)s %(message)s")
+    file_formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -40,8 +68,8 @@ def setup_logging(
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(console_formatter)
+        handlers.append(console_handler)
 
     # File handler
     if log_file is not None or level <= logging.DEBUG:
@@ -52,8 +80,13 @@ def setup_logging(
 
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(file_formatter)
+        handlers.append(file_handler)
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     logger.info(f"Logging initialized at {logging.getLevelName(level)} level")
     if log_file:
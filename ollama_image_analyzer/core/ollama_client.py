@@ -4,12 +4,15 @@ Provides a clean interface to the Ollama API for analyzing images
 with vision models.
 """
 
-import base64
 import logging
+import os
 import re
+import shutil
+import string
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union, Tuple
 from datetime import datetime
 
 import ollama
@@ -20,10 +23,40 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Use the libyaml C emitter for sidecars when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+
+def _write_small_file(path: Path, data: bytes, exclusive: bool = False) -> None:
+    """Write a small file with one open/write/close syscall sequence.
+
+    Avoids the extra fstat/ioctl/lseek calls the buffered open() layer makes.
+    With exclusive=True the file must not exist yet (FileExistsError otherwise).
+    """
+    mode = os.O_EXCL if exclusive else os.O_TRUNC
+    fd = os.open(
+        path,
+        os.O_WRONLY | os.O_CREAT | mode | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0),
+        0o666,  # Same as open(); the umask applies
+    )
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@dataclass(slots=True, frozen=True)
 class AnalysisResult:
-    """Result of an image analysis."""
+    """Result of an image analysis.
+
+    Immutable and slotted: one is created per image, so a large batch avoids
+    a per-instance __dict__ and results can be shared across threads safely.
+    """
 
     success: bool
     response: str
@@ -62,13 +95,25 @@ class OllamaAnalyzer:
     """Client for analyzing images with Ollama vision models."""
 
     # Supported image formats
-    SUPPORTED_FORMATS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tiff"}
+    SUPPORTED_FORMATS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tiff"})
+
+    # Common vision model names/prefixes ("bakllava" is covered by "llava")
+    _VISION_MODEL_PATTERN = re.compile(r"llava|moondream|vision|clip", re.IGNORECASE)
+
+    # Responses longer than this are treated as runaway generation
+    MAX_RESPONSE_WORDS = 10000
+
+    # Deletion tables used by validate_response() to drop "normal" ASCII characters
+    _ASCII_ALNUM_SPACE = str.maketrans("", "", string.ascii_letters + string.digits + string.whitespace)
+    _ASCII_ALNUM_SPACE_BYTES = bytes(i for i in range(128) if chr(i).isalnum() or chr(i).isspace())
 
     def __init__(
         self,
         host: str = "http://localhost:11434",
         model: str = "llava",
         timeout: int = 300,
+        keep_alive: Union[str, float] = "30m",
+        num_thread: int = 0,
     ) -> None:
         """
         Initialize the Ollama analyzer.
@@ -77,19 +122,47 @@ class OllamaAnalyzer:
             host: Ollama server URL (e.g., 'http://localhost:11434')
             model: Vision model name (e.g., 'llava', 'bakllava', 'moondream')
             timeout: Request timeout in seconds
+            keep_alive: How long Ollama keeps the model loaded after a request
+            num_thread: CPU threads Ollama uses for generation (0 leaves it to the server)
         """
         self.host = host
         self.model = model
         self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.num_thread = num_thread
         self._client: Optional[Client] = None
+        self._client_lock = threading.Lock()
 
     @property
     def client(self) -> Client:
-        """Get or create the Ollama client."""
+        """
+        Get or create the Ollama client.
+
+        A single client (and its keep-alive HTTP connection pool) is shared by
+        every request made through this analyzer, including from worker threads.
+        """
         if self._client is None:
-            self._client = Client(host=self.host, timeout=self.timeout)
+            with self._client_lock:
+                if self._client is None:
+                    self._client = Client(host=self.host, timeout=self.timeout)
         return self._client
 
+    def close(self) -> None:
+        """Close the shared HTTP connection pool, if one was opened."""
+        with self._client_lock:
+            if self._client is not None:
+                # Older ollama releases lack Client.close(); close httpx directly
+                close = getattr(self._client, "close", None) or self._client._client.close
+                close()
+                self._client = None
+
+    @property
+    def options(self) -> Optional[Dict[str, Any]]:
+        """Model options sent with every request, or None for server defaults."""
+        if self.num_thread > 0:
+            return {"num_thread": self.num_thread}
+        return None
+
     def _get_numbered_path(self, original_path: Path) -> Path:
         """
         Generate a numbered file path if the original exists.
@@ -107,15 +180,38 @@ class OllamaAnalyzer:
         suffix = original_path.suffix
         parent = original_path.parent
         
-        counter = 1
+        # One directory listing instead of probing file_1, file_2, ... in turn
+        pattern = re.compile(rf"{re.escape(stem)}_(\d+){re.escape(suffix)}")
+        counter = max(
+            (int(match.group(1)) for name in os.listdir(parent) if (match := pattern.fullmatch(name))),
+            default=0,
+        ) + 1
+        return parent / f"{stem}_{counter}{suffix}"
+
+    def _write_numbered(self, output_path: Path, data: bytes) -> Path:
+        """
+        Write a new file, using a numbered path if the original exists.
+        
+        Each candidate is created exclusively, so concurrent saves that map
+        to the same file (e.g. photo.jpg and photo.png both saving photo.txt)
+        never pick the same numbered path; the loser moves on to the next one.
+        
+        Args:
+            output_path: The preferred file path.
+            
+        Returns:
+            The path that was written.
+        """
+        path = output_path
         while True:
-            new_path = parent / f"{stem}_{counter}{suffix}"
-            if not new_path.exists():
-                return new_path
-            counter += 1
-            # Safety limit to prevent infinite loop
-            if counter > 9999:
-                raise IOError(f"Too many numbered files for {original_path.name}")
+            try:
+                _write_small_file(path, data, exclusive=True)
+                break
+            except FileExistsError:
+                path = self._get_numbered_path(output_path)
+        if path != output_path:
+            logger.info(f"File exists, using numbered path: {path}")
+        return path
 
     def test_connection(self) -> bool:
         """
@@ -133,6 +229,31 @@ class OllamaAnalyzer:
             logger.error(f"Failed to connect to Ollama at {self.host}: {e}")
             return False
 
+    def warmup(self, model: Optional[str] = None) -> bool:
+        """
+        Load the model into memory ahead of a batch.
+
+        Sends an empty generate request so the first image doesn't pay the
+        model load time, and keep_alive keeps it resident between images.
+
+        Args:
+            model: Model to load (if None, uses self.model).
+
+        Returns:
+            True if the model was loaded, False otherwise.
+        """
+        model = model or self.model
+        try:
+            response = self.client.generate(
+                model=model, prompt="", keep_alive=self.keep_alive, options=self.options
+            )
+            load_duration = response.get("load_duration") or 0
+            logger.info(f"Warmed up model {model} (load time {load_duration / 1_000_000_000:.2f}s)")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to warm up model {model}: {e}")
+            return False
+
     def list_models(self) -> List[str]:
         """
         Get list of available models from Ollama server.
@@ -180,13 +301,7 @@ class OllamaAnalyzer:
         """
         try:
             all_models = self.list_models()
-            # Common vision model names/prefixes
-            vision_keywords = ["llava", "bakllava", "moondream", "vision", "clip"]
-            
-            vision_models = [
-                model for model in all_models
-                if any(keyword in model.lower() for keyword in vision_keywords)
-            ]
+            vision_models = [model for model in all_models if self._VISION_MODEL_PATTERN.search(model)]
             
             if not vision_models:
                 logger.warning("No obvious vision models found, returning all models")
@@ -210,24 +325,154 @@ class OllamaAnalyzer:
         """
         return file_path.suffix.lower() in OllamaAnalyzer.SUPPORTED_FORMATS
 
-    def _encode_image(self, image_path: Path) -> str:
+    @classmethod
+    def iter_supported(cls, directory: Path) -> Iterator[Path]:
+        """
+        Yield the supported image files directly inside a directory.
+
+        Uses a single os.scandir pass; DirEntry caches the file type from the
+        directory read, so no per-entry stat is needed. Hidden files are
+        skipped, matching glob('*') semantics.
+
+        Args:
+            directory: Directory to scan (not recursive).
+
+        Yields:
+            Paths of supported image files, in directory order.
         """
-        Encode image to base64 string.
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if os.path.splitext(entry.name)[1].lower() in cls.SUPPORTED_FORMATS and entry.is_file():
+                    yield Path(entry.path)
+
+    @staticmethod
+    def read_image(image_path: Path) -> bytes:
+        """
+        Read raw image bytes for the request payload.
+
+        The ollama client base64-encodes bytes itself, so no Python-level
+        encode pass (or intermediate str copy) is needed here. The Ollama API
+        only accepts inline image data, so the bytes are uploaded even when
+        the server runs on the same host. The client's Image model only takes
+        bytes/str/Path, so an mmap can't be handed over without copying it
+        into bytes anyway; read_bytes() sizes its buffer from fstat and reads
+        the file in a single allocation.
 
         Args:
             image_path: Path to the image file.
 
         Returns:
-            Base64-encoded image string.
+            The image file contents.
+        """
+        return image_path.read_bytes()
+
+    def _check_image(self, image_path: Path, model: str) -> Optional[AnalysisResult]:
         """
-        with open(image_path, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
+        Validate that an image can be analyzed.
+
+        Args:
+            image_path: Path to the image file.
+            model: Model the analysis would use.
+
+        Returns:
+            A failed AnalysisResult if the image is unusable, otherwise None.
+        """
+        if not image_path.exists():
+            error_msg = f"Image file not found: {image_path}"
+        elif not self.is_supported_image(image_path):
+            error_msg = f"Unsupported image format: {image_path.suffix}"
+        else:
+            return None
+
+        logger.error(error_msg)
+        return AnalysisResult(
+            success=False,
+            response="",
+            model=model,
+            error=error_msg,
+            image_path=image_path,
+        )
+
+    @staticmethod
+    def _build_messages(image_data: bytes, prompt: str) -> List[dict]:
+        """Build the chat messages payload for a single image."""
+        return [
+            {
+                "role": "user",
+                "content": prompt,
+                "images": [image_data],
+            }
+        ]
+
+    @staticmethod
+    def _result_from_response(
+        response: Any,
+        model: str,
+        image_path: Path,
+        response_text: Optional[str] = None,
+    ) -> AnalysisResult:
+        """Convert an Ollama chat response into an AnalysisResult.
+
+        For streamed responses, pass the final chunk (which carries the
+        metrics) together with the accumulated response_text.
+        """
+        if response_text is None:
+            response_text = response["message"]["content"]
+        
+        # Extract performance metrics
+        total_duration = response.get("total_duration")
+        load_duration = response.get("load_duration")
+        prompt_eval_count = response.get("prompt_eval_count")
+        prompt_eval_duration = response.get("prompt_eval_duration")
+        eval_count = response.get("eval_count")
+        eval_duration = response.get("eval_duration")
+        
+        # Calculate tokens/sec if available
+        if eval_count and eval_duration:
+            tokens_per_sec = eval_count / (eval_duration / 1_000_000_000)
+            logger.info(f"Analysis complete: {len(response_text)} chars, {eval_count} tokens, {tokens_per_sec:.2f} tok/s")
+        else:
+            logger.info(f"Analysis complete: {len(response_text)} chars")
+        if load_duration:
+            # Should stay near zero after warmup() while the model is kept alive
+            logger.debug(f"Model load time for {image_path.name}: {load_duration / 1_000_000_000:.2f}s")
+
+        return AnalysisResult(
+            success=True,
+            response=response_text,
+            model=model,
+            image_path=image_path,
+            total_duration=total_duration,
+            load_duration=load_duration,
+            prompt_eval_count=prompt_eval_count,
+            prompt_eval_duration=prompt_eval_duration,
+            eval_count=eval_count,
+            eval_duration=eval_duration,
+        )
+
+    @staticmethod
+    def _error_result(error: Exception, model: str, image_path: Path) -> AnalysisResult:
+        """Build a failed AnalysisResult for an exception raised during analysis."""
+        logger.error(f"Error analyzing {image_path.name}: {error}", exc_info=error)
+        return AnalysisResult(
+            success=False,
+            response="",
+            model=model,
+            error=f"Analysis failed: {str(error)}",
+            image_path=image_path,
+        )
 
     def analyze_image(
         self,
         image_path: Union[str, Path],
         prompt: str,
         model: Optional[str] = None,
+        stream: bool = False,
+        image_data: Optional[bytes] = None,
+        cancel_event: Optional[threading.Event] = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> AnalysisResult:
         """
         Analyze an image using Ollama vision model.
@@ -236,6 +481,14 @@ class OllamaAnalyzer:
             image_path: Path to the image file.
             prompt: Prompt/instructions for the analysis.
             model: Model to use (if None, uses self.model).
+            stream: Consume the response as it is generated and stop the
+                request early once it exceeds MAX_RESPONSE_WORDS.
+            image_data: Image bytes already read with read_image() (if None,
+                the file is read here).
+            cancel_event: When set while streaming, the request is abandoned
+                at the next chunk and a failed result is returned.
+            on_text: Called with each piece of response text as it arrives
+                while streaming (runs on the calling thread).
 
         Returns:
             AnalysisResult with the response or error.
@@ -244,89 +497,111 @@ class OllamaAnalyzer:
         model = model or self.model
 
         # Validate image file
-        if not image_path.exists():
-            error_msg = f"Image file not found: {image_path}"
-            logger.error(error_msg)
-            return AnalysisResult(
-                success=False,
-                response="",
-                model=model,
-                error=error_msg,
-                image_path=image_path,
-            )
-
-        if not self.is_supported_image(image_path):
-            error_msg = f"Unsupported image format: {image_path.suffix}"
-            logger.error(error_msg)
-            return AnalysisResult(
-                success=False,
-                response="",
-                model=model,
-                error=error_msg,
-                image_path=image_path,
-            )
+        failed = self._check_image(image_path, model)
+        if failed is not None:
+            return failed
 
         # Perform analysis
         try:
             logger.info(f"Analyzing {image_path.name} with model {model}")
             
+            if image_data is None:
+                image_data = self.read_image(image_path)
+            messages = self._build_messages(image_data, prompt)
+            if stream:
+                return self._analyze_streaming(messages, model, image_path, cancel_event, on_text)
+
             response = self.client.chat(
                 model=model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                        "images": [str(image_path)],
-                    }
-                ],
+                messages=messages,
+                keep_alive=self.keep_alive,
+                options=self.options,
             )
+            return self._result_from_response(response, model, image_path)
 
-            response_text = response["message"]["content"]
-            
-            # Extract performance metrics
-            total_duration = response.get("total_duration")
-            load_duration = response.get("load_duration")
-            prompt_eval_count = response.get("prompt_eval_count")
-            prompt_eval_duration = response.get("prompt_eval_duration")
-            eval_count = response.get("eval_count")
-            eval_duration = response.get("eval_duration")
-            
-            # Calculate tokens/sec if available
-            if eval_count and eval_duration:
-                tokens_per_sec = eval_count / (eval_duration / 1_000_000_000)
-                logger.info(f"Analysis complete: {len(response_text)} chars, {eval_count} tokens, {tokens_per_sec:.2f} tok/s")
-            else:
-                logger.info(f"Analysis complete: {len(response_text)} chars")
+        except Exception as e:
+            return self._error_result(e, model, image_path)
 
-            return AnalysisResult(
-                success=True,
-                response=response_text,
-                model=model,
-                image_path=image_path,
-                total_duration=total_duration,
-                load_duration=load_duration,
-                prompt_eval_count=prompt_eval_count,
-                prompt_eval_duration=prompt_eval_duration,
-                eval_count=eval_count,
-                eval_duration=eval_duration,
-            )
+    def _analyze_streaming(
+        self,
+        messages: List[dict],
+        model: str,
+        image_path: Path,
+        cancel_event: Optional[threading.Event] = None,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> AnalysisResult:
+        """
+        Run a streaming chat request, aborting runaway or cancelled generations.
 
-        except Exception as e:
-            error_msg = f"Analysis failed: {str(e)}"
-            logger.error(f"Error analyzing {image_path.name}: {e}", exc_info=True)
-            return AnalysisResult(
-                success=False,
-                response="",
-                model=model,
-                error=error_msg,
-                image_path=image_path,
-            )
+        Words are counted incrementally as chunks arrive; once the count passes
+        MAX_RESPONSE_WORDS, or cancel_event is set, the stream is closed, which
+        drops the connection and stops the server generating further tokens.
+
+        Args:
+            messages: Chat messages payload.
+            model: Model to use.
+            image_path: Path to the image being analyzed.
+            cancel_event: Event checked between chunks to abandon the request.
+            on_text: Called with each piece of response text as it arrives.
+
+        Returns:
+            AnalysisResult with the response or error.
+        """
+        chunks = self.client.chat(
+            model=model,
+            messages=messages,
+            keep_alive=self.keep_alive,
+            options=self.options,
+            stream=True,
+        )
+        parts: List[str] = []
+        word_count = 0
+        in_word = False
+        final = None
+        try:
+            for chunk in chunks:
+                if cancel_event is not None and cancel_event.is_set():
+                    logger.info(f"{image_path.name}: analysis cancelled")
+                    return AnalysisResult(
+                        success=False,
+                        response="",
+                        model=model,
+                        error="Analysis cancelled",
+                        image_path=image_path,
+                    )
+                text = chunk["message"]["content"]
+                if text:
+                    parts.append(text)
+                    if on_text is not None:
+                        on_text(text)
+                    # Count words split across chunk boundaries only once
+                    word_count += len(text.split()) - (in_word and not text[0].isspace())
+                    in_word = not text[-1].isspace()
+                    if word_count > self.MAX_RESPONSE_WORDS:
+                        error_msg = (
+                            f"Response too long (over {self.MAX_RESPONSE_WORDS} words), "
+                            "generation stopped"
+                        )
+                        logger.warning(f"{image_path.name}: {error_msg}")
+                        return AnalysisResult(
+                            success=False,
+                            response="",
+                            model=model,
+                            error=error_msg,
+                            image_path=image_path,
+                        )
+                if chunk.get("done"):
+                    final = chunk
+        finally:
+            chunks.close()
+
+        return self._result_from_response(final or {}, model, image_path, "".join(parts))
 
     def validate_response(
         self,
         response: str,
         min_chars: int = 20,
-        max_words: int = 10000,
+        max_words: int = MAX_RESPONSE_WORDS,
         min_avg_word_length: float = 2.0,
     ) -> Tuple[bool, Optional[str]]:
         """
@@ -359,24 +634,30 @@ class OllamaAnalyzer:
             return False, f"Response too long ({word_count} words, maximum {max_words})"
         
         # Check for gibberish - calculate average word length
-        if words:
-            # Filter out very short "words" (likely punctuation)
-            meaningful_words = [w for w in words if len(w) > 1]
-            if meaningful_words:
-                avg_word_length = sum(len(w) for w in meaningful_words) / len(meaningful_words)
-                if avg_word_length < min_avg_word_length:
-                    return False, f"Response appears to be gibberish (avg word length: {avg_word_length:.1f})"
+        # Filter out very short "words" (likely punctuation)
+        meaningful_lengths = [n for n in map(len, words) if n > 1]
+        if meaningful_lengths:
+            avg_word_length = sum(meaningful_lengths) / len(meaningful_lengths)
+            if avg_word_length < min_avg_word_length:
+                return False, f"Response appears to be gibberish (avg word length: {avg_word_length:.1f})"
         
-        # Check for excessive non-alphanumeric characters (gibberish detection)
-        alphanumeric_chars = sum(c.isalnum() or c.isspace() for c in response)
-        if alphanumeric_chars / len(response) < 0.7:  # Less than 70% normal characters
+        # Check for excessive non-alphanumeric characters (gibberish detection).
+        # translate() strips ASCII letters/digits/whitespace in C; for pure
+        # ASCII text what is left is exactly the special characters, otherwise
+        # the leftover (punctuation and non-ASCII text) is checked per character.
+        if response.isascii():
+            special_chars = len(response.encode("ascii").translate(None, self._ASCII_ALNUM_SPACE_BYTES))
+        else:
+            leftover = response.translate(self._ASCII_ALNUM_SPACE)
+            special_chars = sum(not (c.isalnum() or c.isspace()) for c in leftover)
+        if (len(response) - special_chars) / len(response) < 0.7:  # Less than 70% normal characters
             return False, "Response contains excessive special characters (possible gibberish)"
         
         # Check for repetitive patterns (e.g., "word word word word...")
-        if len(words) >= 10:
+        if word_count >= 10:
             # Check if more than 50% of words are the same
-            unique_words = set(w.lower() for w in words)
-            if len(unique_words) / len(words) < 0.3:
+            unique_words = set(response.lower().split())
+            if len(unique_words) / word_count < 0.3:
                 return False, "Response contains excessive repetition"
         
         return True, None
@@ -418,16 +699,15 @@ class OllamaAnalyzer:
                 raise ValueError("Cannot determine output path: no image_path in result")
             output_path = result.image_path.with_suffix(".txt")
 
-        # Check if file exists and handle accordingly
-        if not overwrite and output_path.exists():
-            output_path = self._get_numbered_path(output_path)
-            logger.info(f"File exists, using numbered path: {output_path}")
-
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(result.response)
+            # One encode + write; skips the TextIOWrapper/encoder stack
+            data = result.response.encode("utf-8")
+            if overwrite:
+                _write_small_file(output_path, data)
+            else:
+                output_path = self._write_numbered(output_path, data)
             
             logger.info(f"Saved analysis result to {output_path}")
             return output_path
@@ -441,6 +721,7 @@ class OllamaAnalyzer:
         result: AnalysisResult,
         output_path: Optional[Path] = None,
         overwrite: bool = True,
+        timestamp: Optional[str] = None,
     ) -> Path:
         """
         Save analysis result as PhotoPrism-compatible YAML sidecar file.
@@ -449,6 +730,7 @@ class OllamaAnalyzer:
             result: The analysis result to save.
             output_path: Where to save (if None, saves next to image as .yml).
             overwrite: If False and file exists, will create numbered version (file.jpg_1.yml, file.jpg_2.yml, etc.).
+            timestamp: ISO timestamp for the TakenAt field (if None, uses the current time).
 
         Returns:
             Path where the YAML file was saved.
@@ -473,11 +755,6 @@ class OllamaAnalyzer:
                 raise ValueError("Cannot determine output path: no image_path in result")
             output_path = result.image_path.with_suffix(result.image_path.suffix + ".yml")
 
-        # Check if file exists and handle accordingly
-        if not overwrite and output_path.exists():
-            output_path = self._get_numbered_path(output_path)
-            logger.info(f"YAML file exists, using numbered path: {output_path}")
-
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
@@ -485,7 +762,7 @@ class OllamaAnalyzer:
             yaml_data = {
                 "Title": result.image_path.stem if result.image_path else "",
                 "Description": result.response,
-                "TakenAt": datetime.now().isoformat(),
+                "TakenAt": timestamp or datetime.now().isoformat(),
                 "Details": {
                     "AI_Model": result.model,
                     "AI_Generated": True,
@@ -493,8 +770,18 @@ class OllamaAnalyzer:
                 }
             }
             
-            with open(output_path, "w", encoding="utf-8") as f:
-                yaml.dump(yaml_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            yaml_bytes = yaml.dump(
+                yaml_data,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+                encoding="utf-8",  # Emit bytes directly
+            )
+            if overwrite:
+                _write_small_file(output_path, yaml_bytes)
+            else:
+                output_path = self._write_numbered(output_path, yaml_bytes)
             
             logger.info(f"Saved YAML sidecar to {output_path}")
             return output_path
@@ -532,18 +819,26 @@ class OllamaAnalyzer:
             if backup:
                 backup_path = result.image_path.with_suffix(result.image_path.suffix + ".bak")
                 if not backup_path.exists():
-                    import shutil
-                    shutil.copy2(result.image_path, backup_path)
+                    try:
+                        # The image is rewritten to a new file below, so a
+                        # hardlink keeps the original bytes without copying them
+                        os.link(result.image_path, backup_path)
+                    except OSError:
+                        # Cross-device or no hardlink support
+                        shutil.copy2(result.image_path, backup_path)
                     logger.info(f"Created backup at {backup_path}")
 
-            # Open image
-            img = Image.open(result.image_path)
+            # JPEG EXIF lives in its own APP1 segment, so it can be patched in
+            # place; other formats have to be re-encoded through Pillow
+            is_jpeg = result.image_path.suffix.lower() in {".jpg", ".jpeg"}
+            img = None if is_jpeg else Image.open(result.image_path)
             
             # Try to get existing EXIF data
             exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
-            if "exif" in img.info:
+            exif_source = str(result.image_path) if is_jpeg else img.info.get("exif")
+            if exif_source:
                 try:
-                    exif_dict = piexif.load(img.info["exif"])
+                    exif_dict = piexif.load(exif_source)
                 except Exception as e:
                     logger.warning(f"Could not load existing EXIF data: {e}, creating new")
             
@@ -556,8 +851,21 @@ class OllamaAnalyzer:
             # Compile EXIF data
             exif_bytes = piexif.dump(exif_dict)
             
-            # Save image with new EXIF data
-            img.save(result.image_path, exif=exif_bytes)
+            # Write to a temporary file and rename it over the image, so the
+            # original inode (and any hardlinked backup) is never modified
+            tmp_path = result.image_path.with_name(f".{result.image_path.name}.tmp")
+            try:
+                if is_jpeg:
+                    # Replace only the EXIF segment; pixel data is left byte-identical
+                    piexif.insert(exif_bytes, str(result.image_path), str(tmp_path))
+                else:
+                    # Save image with new EXIF data
+                    with img:
+                        img.save(tmp_path, format=img.format, exif=exif_bytes)
+                shutil.copymode(result.image_path, tmp_path)
+                os.replace(tmp_path, result.image_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
             
             logger.info(f"Wrote metadata to {result.image_path}")
             return True
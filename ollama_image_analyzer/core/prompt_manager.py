@@ -5,7 +5,7 @@ Handles loading, saving, and managing user-editable prompts for image analysis.
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +37,8 @@ class PromptManager:
         
         self.default_prompt_path = default_prompt_path
         self._current_prompt: Optional[str] = None
+        # path -> ((st_mtime_ns, st_size), prompt); files are only re-read when modified
+        self._cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
 
     def load_prompt(self, prompt_path: Optional[Path] = None) -> str:
         """
@@ -52,15 +54,25 @@ class PromptManager:
             FileNotFoundError: If the prompt file doesn't exist.
             IOError: If there's an error reading the file.
         """
-        path = prompt_path or self.default_prompt_path
+        path = Path(prompt_path or self.default_prompt_path)
         
         try:
+            # Size is checked too: on coarse-mtime filesystems (FAT, HFS+) an
+            # edit within the same second keeps the modification time
+            stat = path.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == version:
+                self._current_prompt = cached[1]
+                return cached[1]
+            
             with open(path, "r", encoding="utf-8") as f:
                 prompt = f.read().strip()
             
             if not prompt:
                 raise ValueError(f"Prompt file is empty: {path}")
             
+            self._cache[path] = (version, prompt)
             self._current_prompt = prompt
             logger.info(f"Loaded prompt from {path} ({len(prompt)} characters)")
             return prompt
@@ -95,6 +107,10 @@ class PromptManager:
             with open(path, "w", encoding="utf-8") as f:
                 f.write(prompt.strip() + "\n")
             
+            # Cache what was just written, so a quick reload can't match a
+            # stale entry whose mtime the filesystem didn't visibly change
+            stat = path.stat()
+            self._cache[path] = ((stat.st_mtime_ns, stat.st_size), prompt.strip())
             self._current_prompt = prompt.strip()
             logger.info(f"Saved prompt to {path} ({len(prompt)} characters)")
             
@@ -0,0 +1,228 @@
+"""Persistent cache of analysis results.
+
+Results are keyed by the image content, prompt and model, so re-running a
+batch over unchanged images skips the Ollama request entirely. Image digests
+are stored too, keyed by path, modification time and size, so unchanged
+images don't even have to be read again to find their results. Both tables
+are capped, dropping the least recently written rows first.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .ollama_client import AnalysisResult
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=16)
+def _request_hash(prompt: str, model: str) -> str:
+    """Hash the prompt and model; a batch asks for the same pair per image."""
+    return hashlib.sha1(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """SQLite-backed cache mapping (image bytes, prompt, model) to results."""
+
+    MAX_ENTRIES = 10000  # Rows kept per table
+
+    def __init__(self, db_path: Path, max_entries: int = MAX_ENTRIES) -> None:
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            max_entries: Maximum number of results (and of image digests) kept.
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by the batch worker threads, serialized by a lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, json TEXT NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS image_digests ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, digest TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def image_digest(image_data: bytes) -> str:
+        """
+        Hash image content for use in cache keys.
+
+        Args:
+            image_data: Raw image file contents.
+
+        Returns:
+            Hex digest of the image content.
+        """
+        return hashlib.blake2b(image_data, digest_size=16).hexdigest()
+
+    @staticmethod
+    def make_key(image_data: bytes, prompt: str, model: str) -> str:
+        """
+        Build the cache key for an analysis.
+
+        Args:
+            image_data: Raw image file contents.
+            prompt: Prompt used for the analysis.
+            model: Model used for the analysis.
+
+        Returns:
+            Hex digest key combining the image content and the prompt/model.
+        """
+        return ResultCache.make_key_for_digest(ResultCache.image_digest(image_data), prompt, model)
+
+    @staticmethod
+    def make_key_for_digest(image_digest: str, prompt: str, model: str) -> str:
+        """
+        Build the cache key from an image digest computed earlier.
+
+        Args:
+            image_digest: Digest from image_digest().
+            prompt: Prompt used for the analysis.
+            model: Model used for the analysis.
+
+        Returns:
+            The same key make_key() returns for that image's content.
+        """
+        return f"{image_digest}:{_request_hash(prompt, model)}"
+
+    def lookup_digest(self, image_path: Path, stat: os.stat_result) -> Optional[str]:
+        """
+        Find the stored digest of an image file that hasn't changed since.
+
+        Args:
+            image_path: Path to the image.
+            stat: Current stat of the image.
+
+        Returns:
+            The digest stored by store_digest(), or None if there is none or
+            the file's modification time or size differ.
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT digest FROM image_digests WHERE path = ? AND mtime_ns = ? AND size = ?",
+                    (os.fspath(image_path), stat.st_mtime_ns, stat.st_size),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Image digest lookup failed: {e}")
+            return None
+        return row[0] if row is not None else None
+
+    def store_digest(self, image_path: Path, stat: os.stat_result, digest: str) -> None:
+        """
+        Remember the digest of an image file.
+
+        Args:
+            image_path: Path to the image.
+            stat: Stat of the image taken before it was read.
+            digest: Digest from image_digest().
+        """
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO image_digests (path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+                    (os.fspath(image_path), stat.st_mtime_ns, stat.st_size, digest),
+                )
+                self._prune("image_digests")
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to store image digest: {e}")
+
+    def get(self, key: str, image_path: Optional[Path] = None) -> Optional[AnalysisResult]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from make_key().
+            image_path: Path to attach to the returned result.
+
+        Returns:
+            The cached AnalysisResult, or None on a miss.
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT json FROM results WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache lookup failed: {e}")
+            return None
+        if row is None:
+            return None
+
+        try:
+            data = json.loads(row[0])
+            return AnalysisResult(image_path=image_path, **data)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, result: AnalysisResult) -> None:
+        """
+        Store a successful result.
+
+        Args:
+            key: Key from make_key().
+            result: The analysis result to cache (failed results are ignored).
+        """
+        if not result.success:
+            return
+
+        # The image may be moved or renamed, so its path isn't part of the entry
+        data = dataclasses.asdict(result)
+        del data["image_path"]
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO results (key, json) VALUES (?, ?)",
+                    (key, json.dumps(data)),
+                )
+                self._prune("results")
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to store result in cache: {e}")
+
+    def _prune(self, table: str) -> None:
+        """
+        Drop the oldest rows of a table beyond max_entries.
+
+        REPLACE re-inserts a row under a new rowid, so rowids follow write
+        order and the cutoff is a single index range delete rather than a
+        COUNT over the table. Gaps left by replaced rows only make the cap
+        stricter. Must be called with the lock held.
+
+        Args:
+            table: "results" or "image_digests".
+        """
+        self._connection.execute(
+            f"DELETE FROM {table} WHERE rowid <= (SELECT MAX(rowid) FROM {table}) - ?",
+            (self.max_entries,),
+        )
+
+    def clear(self) -> None:
+        """Remove all cached results and image digests."""
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+            self._connection.execute("DELETE FROM image_digests")
+            self._connection.commit()
+        logger.info(f"Cleared result cache at {self.db_path}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -1,12 +1,18 @@
 """Background worker for batch image analysis."""
 
 import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QThread, Signal, QMutex, QWaitCondition
 
-from ollama_image_analyzer.core import OllamaAnalyzer, AnalysisResult
+from ollama_image_analyzer.core import OllamaAnalyzer, AnalysisResult, ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -18,19 +24,33 @@ class BatchAnalysisWorker(QThread):
     started = Signal()
     finished = Signal(int, int)  # total, successful
     item_started = Signal(int, int, str, object)  # current, total, filename, path
-    item_finished = Signal(AnalysisResult)
+    items_batch_finished = Signal(list)  # AnalysisResults, in chunks of up to RESULT_CHUNK_SIZE
     item_retry = Signal(str, str)  # filename, error_message (emitted when retrying)
     progress = Signal(int)  # Progress percentage (0-100)
     error = Signal(str)  # Error message
     paused = Signal()  # Emitted when analysis is paused
     resumed = Signal()  # Emitted when analysis is resumed
 
+    # Finished results are delivered in chunks, so a burst of fast
+    # completions (e.g. cache hits) costs the GUI one queued call and repaint
+    # per chunk; a chunk is sent once full or once its oldest result has
+    # waited RESULT_FLUSH_INTERVAL seconds
+    RESULT_CHUNK_SIZE = 16
+    RESULT_FLUSH_INTERVAL = 0.25
+
     def __init__(
         self,
         image_paths: List[Path],
         prompt: str,
         analyzer: OllamaAnalyzer,
         parent: Optional[QThread] = None,
+        max_workers: int = 4,
+        prefetch: int = 2,
+        result_cache: Optional[ResultCache] = None,
+        max_concurrent: Optional[int] = None,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """
         Initialize the batch analysis worker.
@@ -40,13 +60,45 @@ class BatchAnalysisWorker(QThread):
             prompt: Analysis prompt.
             analyzer: OllamaAnalyzer instance.
             parent: Parent object.
+            max_workers: Number of images analyzed concurrently.
+            prefetch: Number of images read from disk ahead of the analyses.
+            result_cache: Cache of earlier results to reuse (if None, every
+                image is analyzed).
+            max_concurrent: Maximum number of Ollama requests in flight (if
+                None, max_workers). Each attempt holds a slot only while its
+                request runs, so retries queue behind other images.
+            max_attempts: Attempts per image before it is reported as failed.
+            backoff_base: Delay before the first retry in seconds; doubled
+                for each further retry, plus up to 0.25s of random jitter.
+            executor: Long-lived pool to run the analyses on (if None, a pool
+                of max_workers threads is created for this batch). The
+                caller keeps ownership and shuts it down.
         """
         super().__init__(parent)
         
         self.image_paths = image_paths
         self.prompt = prompt
         self.analyzer = analyzer
+        self.max_workers = max(1, max_workers)
+        self.prefetch = max(0, prefetch)
+        self.result_cache = result_cache
+        self._request_slots = threading.BoundedSemaphore(max(1, max_concurrent or self.max_workers))
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self._executor = executor
+        
+        # Processing order (largest files first), set when the batch starts
+        self._schedule: List[Path] = []
+        
+        # Images looked up in the cache or read ahead of the analyses that need them
+        self._reader: Optional[ThreadPoolExecutor] = None
+        self._reads: Dict[int, Future] = {}
+        self._next_read = 0
+        self._read_lock = threading.Lock()
+        self._warmup_lock = threading.Lock()
+        self._warmed_up = False
         self._should_stop = False
+        self._stop_event = threading.Event()  # Interrupts retry backoff sleeps
         self._is_paused = False
         self._pause_mutex = QMutex()
         self._pause_condition = QWaitCondition()
@@ -54,6 +106,7 @@ class BatchAnalysisWorker(QThread):
     def stop(self) -> None:
         """Request the worker to stop processing."""
         self._should_stop = True
+        self._stop_event.set()
         # Resume if paused to allow stop to complete
         self.resume()
     
@@ -81,6 +134,244 @@ class BatchAnalysisWorker(QThread):
         self._pause_mutex.unlock()
         return paused
     
+    def _wait_if_paused(self) -> None:
+        """Block the calling thread while the batch is paused."""
+        self._pause_mutex.lock()
+        while self._is_paused and not self._should_stop:
+            self._pause_condition.wait(self._pause_mutex)
+        self._pause_mutex.unlock()
+    
+    @staticmethod
+    def _file_size(image_path: Path) -> int:
+        """Size of an image file in bytes, or 0 if it can't be read."""
+        try:
+            return image_path.stat().st_size
+        except OSError:
+            return 0
+    
+    def _take_image(
+        self, slot: int
+    ) -> Optional[Tuple[Optional[AnalysisResult], Optional[bytes], Optional[str]]]:
+        """
+        Get a prefetched image and schedule reads further ahead.
+        
+        A single reader thread loads images (see _load_image) while earlier
+        images are being analyzed, keeping at most `prefetch` reads ahead of
+        the analyses in progress.
+        
+        Args:
+            slot: 0-based position of the image in the processing order.
+        
+        Returns:
+            Cached result, image bytes and result cache key, as returned by
+            _load_image(). If the read failed all three are None, and
+            analyze_image then reads the file itself and reports the error.
+            None if the batch was stopped.
+        """
+        with self._read_lock:
+            # run() shuts the reader down under this lock after a stop, so
+            # checking here keeps submit() from racing the shutdown
+            if self._should_stop:
+                return None
+            read_until = min(slot + 1 + self.prefetch, len(self._schedule))
+            while self._next_read < read_until:
+                self._reads[self._next_read] = self._reader.submit(
+                    self._load_image, self._schedule[self._next_read]
+                )
+                self._next_read += 1
+            pending = self._reads.pop(slot)
+        
+        try:
+            return pending.result()
+        except Exception:
+            # Reads still queued are cancelled when the batch stops
+            if self._should_stop:
+                return None
+            return None, None, None
+    
+    def _load_image(
+        self, image_path: Path
+    ) -> Tuple[Optional[AnalysisResult], Optional[bytes], Optional[str]]:
+        """
+        Find an image's cached result, or read it for analysis.
+        
+        Runs on the reader thread. The image's digest is looked up by path,
+        modification time and size first, so an unchanged image with a
+        cached result is never read; otherwise its bytes are read and, when
+        caching, hashed and the digest stored for the next run.
+        
+        Args:
+            image_path: Path to the image.
+        
+        Returns:
+            (cached result, None, key) on a cache hit, otherwise
+            (None, image bytes, key); the key is None when caching is off.
+        """
+        cache = self.result_cache
+        if cache is None:
+            return None, self.analyzer.read_image(image_path), None
+        
+        stat = os.stat(image_path)
+        digest = cache.lookup_digest(image_path, stat)
+        image_data = None
+        if digest is None:
+            image_data = self.analyzer.read_image(image_path)
+            digest = ResultCache.image_digest(image_data)
+            cache.store_digest(image_path, stat, digest)
+        
+        cache_key = ResultCache.make_key_for_digest(digest, self.prompt, self.analyzer.model)
+        cached = cache.get(cache_key, image_path)
+        if cached is not None:
+            return cached, None, cache_key
+        if image_data is None:
+            image_data = self.analyzer.read_image(image_path)
+        return None, image_data, cache_key
+    
+    def _analyze_with_retry(
+        self,
+        image_path: Path,
+        current: int,
+        total: int,
+        slot: int,
+    ) -> Optional[AnalysisResult]:
+        """
+        Analyze one image, using the result cache when available.
+        
+        Runs on a pool thread; never raises.
+        
+        Args:
+            image_path: Path to the image to analyze.
+            current: 1-based position of the image in the batch as given.
+            total: Number of images in the batch.
+            slot: 0-based position of the image in the processing order.
+        
+        Returns:
+            The analysis result, or None if the batch was stopped before
+            this image started.
+        """
+        # Check if paused and wait
+        self._wait_if_paused()
+        
+        # Check if we should stop (including after resuming from pause)
+        if self._should_stop:
+            return None
+        
+        name = image_path.name
+        self.item_started.emit(current, total, name, image_path)
+        taken = self._take_image(slot)
+        if taken is None:
+            return None
+        cached, image_data, cache_key = taken
+        
+        # Reuse an earlier result for the same image content, prompt and model
+        if cached is not None:
+            logger.info("Using cached result for %d/%d: %s", current, total, name)
+            return cached
+        
+        result = self._analyze_uncached(image_path, name, image_data, current, total)
+        if result is None:
+            return None
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result)
+        return result
+    
+    def _ensure_warm(self) -> None:
+        """
+        Load the model before the batch's first request to Ollama.
+        
+        Done lazily, so a batch of only cache hits never loads the model; the
+        other threads wait here rather than all queueing on the model load.
+        """
+        if self._warmed_up:
+            return
+        with self._warmup_lock:
+            if not self._warmed_up and not self._should_stop:
+                self.analyzer.warmup()
+                self._warmed_up = True
+    
+    def _request_analysis(self, image_path: Path, image_data: Optional[bytes]) -> AnalysisResult:
+        """Run one analysis request while holding a request slot."""
+        self._ensure_warm()
+        with self._request_slots:
+            # Streaming lets a stop request abandon the response between
+            # chunks instead of waiting for the whole generation
+            return self.analyzer.analyze_image(
+                image_path,
+                self.prompt,
+                stream=True,
+                image_data=image_data,
+                cancel_event=self._stop_event,
+            )
+    
+    def _analyze_uncached(
+        self,
+        image_path: Path,
+        name: str,
+        image_data: Optional[bytes],
+        current: int,
+        total: int,
+    ) -> Optional[AnalysisResult]:
+        """
+        Send one image to Ollama, retrying with exponential backoff on failure.
+        
+        Args:
+            image_path: Path to the image to analyze.
+            name: File name of the image, for logs and signals.
+            image_data: Prefetched image bytes, or None to read the file.
+            current: 1-based position of the image in the batch.
+            total: Number of images in the batch.
+        
+        Returns:
+            The analysis result (failed results are returned, not raised), or
+            None if the batch was stopped while the request was in flight.
+        """
+        logger.info("Analyzing %d/%d: %s", current, total, name)
+        errors: List[str] = []
+        result: Optional[AnalysisResult] = None
+        
+        for attempt in range(self.max_attempts):
+            if attempt:
+                # Back off so a briefly overloaded server isn't hit again
+                # straight away; a stop request cuts the wait short
+                delay = self.backoff_base * (2 ** (attempt - 1)) + random.uniform(0, 0.25)
+                if self._stop_event.wait(delay):
+                    break
+            
+            try:
+                result = self._request_analysis(image_path, image_data)
+            except Exception as e:
+                logger.error("Exception analyzing %s: %s", name, e, exc_info=True)
+                errors.append(str(e))
+                result = None
+                error_msg = str(e)
+            else:
+                if result.success:
+                    if attempt:
+                        logger.info("Retry successful for %s", name)
+                    return result
+                error_msg = result.error or "Unknown error"
+                errors.append(error_msg)
+            
+            # A failure after Stop is the cancellation itself, not worth retrying
+            if self._should_stop:
+                logger.info("Analysis of %s cancelled", name)
+                return None
+            
+            if attempt + 1 < self.max_attempts:
+                logger.warning("Analysis failed for %s: %s. Retrying...", name, error_msg)
+                self.item_retry.emit(name, error_msg)
+        
+        logger.error("Giving up on %s after %d attempts: %s", name, len(errors), "; ".join(errors))
+        if result is not None:
+            return result
+        return AnalysisResult(
+            success=False,
+            response="",
+            model=self.analyzer.model,
+            error=f"Failed {len(errors)} times: {'; '.join(errors)}",
+            image_path=image_path
+        )
+    
     def run(self) -> None:
         """Run the batch analysis in a background thread."""
         total = len(self.image_paths)
@@ -89,101 +380,95 @@ class BatchAnalysisWorker(QThread):
         
         try:
             self.started.emit()
-            logger.info(f"Starting batch analysis of {total} images")
+            logger.info("Starting batch analysis of %d images with %d workers", total, self.max_workers)
             
-            for index, image_path in enumerate(self.image_paths):
-                # Check if we should stop
-                if self._should_stop:
-                    logger.info(f"Batch analysis stopped by user after {processed} images")
-                    break
-                
-                # Check if paused and wait
-                self._pause_mutex.lock()
-                while self._is_paused and not self._should_stop:
-                    logger.debug(f"Worker paused at image {index + 1}/{total}")
-                    self._pause_condition.wait(self._pause_mutex)
-                self._pause_mutex.unlock()
-                
-                # Check again if we should stop after resuming from pause
-                if self._should_stop:
-                    logger.info(f"Batch analysis stopped by user after {processed} images")
-                    break
-                
-                # Emit progress
-                current = index + 1
-                self.item_started.emit(current, total, image_path.name, image_path)
-                progress_pct = int((current / total) * 100)
-                self.progress.emit(progress_pct)
+            # Requests are mostly waiting on the Ollama server, so keep several
+            # in flight; results are reported in completion order
+            # Largest files first, so a big image doesn't end up as the lone
+            # straggler at the end of the batch; item_started still reports
+            # each image's position in the list as given
+            positions = sorted(
+                range(total),
+                key=lambda index: self._file_size(self.image_paths[index]),
+                reverse=True,
+            )
+            self._schedule = [self.image_paths[index] for index in positions]
+            self._reader = ThreadPoolExecutor(max_workers=1)
+            self._reads = {}
+            self._next_read = 0
+            # A caller-supplied pool outlives the batch, so only our own is shut down
+            if self._executor is None:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                executor_context = executor
+            else:
+                executor = self._executor
+                executor_context = nullcontext()
+            with self._reader, executor_context:
+                futures = [
+                    executor.submit(self._analyze_with_retry, self.image_paths[index], index + 1, total, slot)
+                    for slot, index in enumerate(positions)
+                ]
+                not_done = set(futures)
+                cancelled = False
+                last_pct = -1
+                pending: List[AnalysisResult] = []
+                flush_at = 0.0
                 
-                try:
-                    # Perform analysis
-                    logger.info(f"Analyzing {current}/{total}: {image_path.name}")
-                    result = self.analyzer.analyze_image(image_path, self.prompt)
-                    
-                    # If analysis failed, retry once
-                    if not result.success:
-                        error_msg = result.error or "Unknown error"
-                        logger.warning(f"Analysis failed for {image_path.name}: {error_msg}. Retrying...")
-                        self.item_retry.emit(image_path.name, error_msg)
-                        
-                        # Retry the analysis
-                        result = self.analyzer.analyze_image(image_path, self.prompt)
-                        
-                        if result.success:
-                            logger.info(f"Retry successful for {image_path.name}")
-                        else:
-                            logger.error(f"Retry also failed for {image_path.name}: {result.error}")
-                    
-                    processed += 1
+                while not_done:
+                    timeout = max(0.0, flush_at - time.monotonic()) if pending else None
+                    done, not_done = wait(not_done, timeout=timeout, return_when=FIRST_COMPLETED)
                     
-                    if result.success:
-                        successful += 1
-                        logger.info(f"Analysis successful: {image_path.name}")
-                    else:
-                        logger.error(f"Analysis failed for {image_path.name}: {result.error}")
+                    # Drop queued images once a stop is requested; requests
+                    # already in flight are abandoned at their next chunk
+                    if self._should_stop and not cancelled:
+                        logger.info("Batch analysis stopped by user after %d images", processed)
+                        for queued in not_done:
+                            queued.cancel()
+                        with self._read_lock:
+                            self._reader.shutdown(wait=False, cancel_futures=True)
+                        cancelled = True
                     
-                    # Emit result for this item
-                    self.item_finished.emit(result)
-                
-                except Exception as e:
-                    # Exception during analysis - retry once
-                    logger.error(f"Exception analyzing {image_path.name}: {e}. Retrying...", exc_info=True)
-                    self.item_retry.emit(image_path.name, str(e))
-                    
-                    try:
-                        # Retry the analysis
-                        result = self.analyzer.analyze_image(image_path, self.prompt)
+                    for future in done:
+                        if future.cancelled():
+                            continue
+                        result = future.result()
+                        if result is None:
+                            continue
                         
+                        processed += 1
                         if result.success:
                             successful += 1
-                            logger.info(f"Retry successful for {image_path.name}")
+                            logger.info("Analysis successful: %s", result.image_path.name)
                         else:
-                            logger.error(f"Retry also failed for {image_path.name}: {result.error}")
+                            logger.error("Analysis failed for %s: %s", result.image_path.name, result.error)
                         
-                        processed += 1
-                        self.item_finished.emit(result)
-                        
-                    except Exception as retry_error:
-                        logger.error(f"Retry also threw exception for {image_path.name}: {retry_error}", exc_info=True)
-                        processed += 1
-                        error_result = AnalysisResult(
-                            success=False,
-                            response="",
-                            model=self.analyzer.model,
-                            error=f"Failed twice: {str(e)}; {str(retry_error)}",
-                            image_path=image_path
-                        )
-                        self.item_finished.emit(error_result)
+                        if not pending:
+                            flush_at = time.monotonic() + self.RESULT_FLUSH_INTERVAL
+                        pending.append(result)
+                    
+                    if pending and (
+                        len(pending) >= self.RESULT_CHUNK_SIZE
+                        or time.monotonic() >= flush_at
+                        or not not_done
+                    ):
+                        self.items_batch_finished.emit(pending)
+                        pending = []
+                    
+                    # Only cross the thread boundary when the percentage changes
+                    progress_pct = processed * 100 // total
+                    if progress_pct != last_pct:
+                        self.progress.emit(progress_pct)
+                        last_pct = progress_pct
             
             # Batch complete (or stopped)
             if self._should_stop:
-                logger.info(f"Batch analysis stopped: {successful}/{processed} successful (out of {total} total)")
+                logger.info("Batch analysis stopped: %d/%d successful (out of %d total)", successful, processed, total)
             else:
-                logger.info(f"Batch analysis complete: {successful}/{total} successful")
+                logger.info("Batch analysis complete: %d/%d successful", successful, total)
             
             self.finished.emit(processed, successful)
         
         except Exception as e:
-            logger.error(f"Batch worker exception: {e}", exc_info=True)
+            logger.error("Batch worker exception: %s", e, exc_info=True)
             self.error.emit(f"Batch analysis error: {str(e)}")
             self.finished.emit(total, successful)
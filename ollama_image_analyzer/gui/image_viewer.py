@@ -1,28 +1,82 @@
 """Image viewer widget with drag-and-drop support."""
 
 import logging
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap, QDragEnterEvent, QDropEvent
+from PySide6.QtCore import Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget, QSizePolicy
 
 logger = logging.getLogger(__name__)
 
+# File extensions accepted by drag and drop
+_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"})
+
 
 class ImageViewer(QWidget):
     """Widget for displaying images with drag-and-drop support."""
 
     # Signal emitted when an image is loaded
     image_loaded = Signal(Path)
+    # Smooth rescale finished on a pool thread: generation, scaled image
+    _smooth_scaled = Signal(int, QImage)
+    # Image decoded on a pool thread: generation, path, cache key, image, error
+    _image_decoded = Signal(int, object, object, QImage, str)
+
+    # Longest edge images are decoded at; resizes scale from this copy
+    # instead of the full-resolution image
+    MAX_DISPLAY_SIZE = 2048
+    # Delay before the smooth rescale after the last resize event (ms)
+    RESIZE_DEBOUNCE_MS = 50
+    # Decoded images kept for reloading recently shown files (each is at
+    # most MAX_DISPLAY_SIZE on its longest edge)
+    IMAGE_CACHE_SIZE = 8
+
+    # Image label styles; built once instead of on every drag event
+    _STYLE_IDLE = """
+        QLabel {
+            background-color: #181825;
+            border: 2px dashed #45475a;
+            border-radius: 8px;
+            color: #6c7086;
+            font-size: 11pt;
+        }
+    """
+    _STYLE_HOVER = """
+        QLabel {
+            background-color: #1e2e3e;
+            border: 2px dashed #89b4fa;
+            border-radius: 8px;
+            color: #89b4fa;
+            font-size: 11pt;
+        }
+    """
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """Initialize the image viewer."""
         super().__init__(parent)
         
         self._current_image: Optional[Path] = None
-        self._pixmap: Optional[QPixmap] = None
+        self._pixmap: Optional[QPixmap] = None  # Display-sized, see MAX_DISPLAY_SIZE
+        self._image: Optional[QImage] = None  # Same, for scaling off the GUI thread
+        # Bumped on every display update so stale background scales are dropped
+        self._scale_generation = 0
+        # Bumped on every load so a slow background decode can't replace a newer image
+        self._load_generation = 0
+        self._image_cache: "OrderedDict[tuple, QImage]" = OrderedDict()
+        self._current_style: Optional[str] = None
+        self._pending_drop_path: Optional[Path] = None  # Validated in dragEnterEvent
+        
+        # Smooth rescale once resizing settles; fast scaling is used meanwhile
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._update_display)
+        self._smooth_scaled.connect(self._on_smooth_scaled)
+        self._image_decoded.connect(self._on_image_decoded)
         
         self._setup_ui()
         
@@ -39,15 +93,7 @@ class ImageViewer(QWidget):
             QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Expanding
         )
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #181825;
-                border: 2px dashed #45475a;
-                border-radius: 8px;
-                color: #6c7086;
-                font-size: 11pt;
-            }
-        """)
+        self._set_label_style(self._STYLE_IDLE)
         
         # Default text
         self._show_placeholder()
@@ -57,6 +103,12 @@ class ImageViewer(QWidget):
         # Enable drag and drop
         self.setAcceptDrops(True)
     
+    def _set_label_style(self, style: str) -> None:
+        """Apply an image label style, skipping Qt's CSS re-parse if unchanged."""
+        if style is not self._current_style:
+            self.image_label.setStyleSheet(style)
+            self._current_style = style
+    
     def _show_placeholder(self) -> None:
         """Show placeholder text when no image is loaded."""
         self.image_label.setText(
@@ -76,49 +128,186 @@ class ImageViewer(QWidget):
             True if successful, False otherwise.
         """
         try:
-            pixmap = QPixmap(str(image_path))
-            
-            if pixmap.isNull():
-                logger.error(f"Failed to load image: {image_path}")
-                return False
+            # Supersede any load_image_async() still decoding
+            self._load_generation += 1
+            cache_key = self._cache_key(image_path)
+            image = self._image_cache.get(cache_key) if cache_key is not None else None
+            if image is None:
+                image, error = self._decode_image(image_path)
+                if image.isNull():
+                    logger.error(f"Failed to load image: {image_path}: {error}")
+                    return False
             
-            self._pixmap = pixmap
-            self._current_image = image_path
-            
-            # Scale pixmap to fit label while maintaining aspect ratio
-            self._update_display()
-            
-            logger.info(f"Loaded image: {image_path.name}")
-            self.image_loaded.emit(image_path)
+            self._remember_image(cache_key, image)
+            self._show_image(image_path, image)
             return True
             
         except Exception as e:
             logger.error(f"Error loading image {image_path}: {e}")
             return False
     
-    def _update_display(self) -> None:
-        """Update the displayed image to fit the current widget size."""
+    def load_image_async(self, image_path: Path) -> None:
+        """
+        Load and display an image, decoding it on a pool thread.
+        
+        The current image stays on screen until the new one is decoded;
+        image_loaded is emitted once it is shown. A later load_image() or
+        load_image_async() call supersedes this one.
+        
+        Args:
+            image_path: Path to the image file.
+        """
+        self._load_generation += 1
+        cache_key = self._cache_key(image_path)
+        image = self._image_cache.get(cache_key) if cache_key is not None else None
+        if image is not None:
+            self._remember_image(cache_key, image)
+            self._show_image(image_path, image)
+            return
+        
+        generation = self._load_generation
+        
+        def decode() -> None:
+            image, error = self._decode_image(image_path)
+            self._image_decoded.emit(generation, image_path, cache_key, image, error)
+        
+        QThreadPool.globalInstance().start(decode)
+    
+    def _on_image_decoded(
+        self,
+        generation: int,
+        image_path: Path,
+        cache_key: Optional[tuple],
+        image: QImage,
+        error: str,
+    ) -> None:
+        """Show an image decoded by load_image_async() unless it was superseded."""
+        if generation != self._load_generation:
+            return
+        if image.isNull():
+            logger.error(f"Failed to load image: {image_path}: {error}")
+            return
+        self._remember_image(cache_key, image)
+        self._show_image(image_path, image)
+    
+    @classmethod
+    def _decode_image(cls, image_path: Path) -> Tuple[QImage, str]:
+        """
+        Decode an image at display size (safe to call off the GUI thread).
+        
+        Args:
+            image_path: Path to the image file.
+        
+        Returns:
+            The decoded image (null on failure) and the reader's error string.
+        """
+        # Let the decoder downsample while decoding (JPEG can scale by
+        # 1/2..1/8 almost for free) instead of decoding at full resolution
+        reader = QImageReader(str(image_path))
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid() and max(size.width(), size.height()) > cls.MAX_DISPLAY_SIZE:
+            reader.setScaledSize(
+                size.scaled(
+                    cls.MAX_DISPLAY_SIZE,
+                    cls.MAX_DISPLAY_SIZE,
+                    Qt.AspectRatioMode.KeepAspectRatio
+                )
+            )
+        image = reader.read()
+        return image, reader.errorString()
+    
+    @staticmethod
+    def _cache_key(image_path: Path) -> Optional[tuple]:
+        """Key decoded images by path and modification time, or None if unreadable."""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        return (str(image_path), stat.st_mtime_ns, stat.st_size)
+    
+    def _remember_image(self, cache_key: Optional[tuple], image: QImage) -> None:
+        """Add a decoded image to the LRU cache, or mark it most recently used."""
+        if cache_key is None:
+            return
+        self._image_cache[cache_key] = image
+        self._image_cache.move_to_end(cache_key)
+        while len(self._image_cache) > self.IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+    
+    def _show_image(self, image_path: Path, image: QImage) -> None:
+        """Display a decoded image and announce it."""
+        self._image = image
+        self._pixmap = QPixmap.fromImage(image)
+        self._current_image = image_path
+        
+        # Scale pixmap to fit label while maintaining aspect ratio; show
+        # a fast scale straight away until the smooth one is ready
+        self._update_display(smooth=False)
+        self._update_display()
+        
+        logger.info(f"Loaded image: {image_path.name}")
+        self.image_loaded.emit(image_path)
+    
+    def _update_display(self, smooth: bool = True) -> None:
+        """
+        Update the displayed image to fit the current widget size.
+        
+        Args:
+            smooth: Use smooth (bilinear) filtering, done on a pool thread and
+                applied when ready; fast filtering is done immediately and is
+                used for the intermediate frames of an interactive resize.
+        """
         if self._pixmap is None:
             return
         
-        # Scale pixmap to fit label
+        self._scale_generation += 1
+        size = self.image_label.size()
+        
+        if smooth:
+            # QPixmap is GUI-thread only, so the pool scales the QImage copy
+            generation = self._scale_generation
+            image = self._image
+            QThreadPool.globalInstance().start(
+                lambda: self._smooth_scaled.emit(
+                    generation,
+                    image.scaled(
+                        size,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+                )
+            )
+            return
+        
+        # Scale the display-sized copy to fit label
         scaled_pixmap = self._pixmap.scaled(
-            self.image_label.size(),
+            size,
             Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
+            Qt.TransformationMode.FastTransformation
         )
         
         self.image_label.setPixmap(scaled_pixmap)
     
+    def _on_smooth_scaled(self, generation: int, image: QImage) -> None:
+        """Show a smooth rescale unless the display has changed since it started."""
+        if generation == self._scale_generation and self._pixmap is not None:
+            self.image_label.setPixmap(QPixmap.fromImage(image))
+    
     def resizeEvent(self, event) -> None:  # type: ignore
         """Handle resize events to rescale the image."""
         super().resizeEvent(event)
         if self._pixmap is not None:
-            self._update_display()
+            self._update_display(smooth=False)
+            self._resize_timer.start()
     
     def clear(self) -> None:
         """Clear the current image."""
+        self._resize_timer.stop()
+        self._scale_generation += 1
+        self._load_generation += 1
         self._pixmap = None
+        self._image = None
         self._current_image = None
         self._show_placeholder()
     
@@ -130,56 +319,35 @@ class ImageViewer(QWidget):
     # Drag and drop support
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Handle drag enter event."""
-        if event.mimeData().hasUrls():
-            # Check if at least one URL is an image file
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_path = Path(url.toLocalFile())
-                    if file_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp']:
-                        event.acceptProposedAction()
-                        self.image_label.setStyleSheet("""
-                            QLabel {
-                                background-color: #1e2e3e;
-                                border: 2px dashed #89b4fa;
-                                border-radius: 8px;
-                                color: #89b4fa;
-                                font-size: 11pt;
-                            }
-                        """)
-                        return
+        mime_data = event.mimeData()
+        if mime_data.hasUrls():
+            # Check if at least one URL is an image file (toLocalFile() is
+            # empty for non-local URLs)
+            for url in mime_data.urls():
+                local_file = url.toLocalFile()
+                if os.path.splitext(local_file)[1].lower() in _IMAGE_EXTS:
+                    # Remember the match so dropEvent doesn't parse the URLs again
+                    self._pending_drop_path = Path(local_file)
+                    event.acceptProposedAction()
+                    self._set_label_style(self._STYLE_HOVER)
+                    return
+        self._pending_drop_path = None
         event.ignore()
     
     def dragLeaveEvent(self, event) -> None:  # type: ignore
         """Handle drag leave event."""
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #181825;
-                border: 2px dashed #45475a;
-                border-radius: 8px;
-                color: #6c7086;
-                font-size: 11pt;
-            }
-        """)
+        self._pending_drop_path = None
+        self._set_label_style(self._STYLE_IDLE)
     
     def dropEvent(self, event: QDropEvent) -> None:
         """Handle drop event."""
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #181825;
-                border: 2px dashed #45475a;
-                border-radius: 8px;
-                color: #6c7086;
-                font-size: 11pt;
-            }
-        """)
-        
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_path = Path(url.toLocalFile())
-                    if file_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp']:
-                        self.load_image(file_path)
-                        event.acceptProposedAction()
-                        return
+        self._set_label_style(self._STYLE_IDLE)
+        
+        # Only drags accepted in dragEnterEvent are delivered here
+        file_path, self._pending_drop_path = self._pending_drop_path, None
+        if file_path is not None:
+            self.load_image(file_path)
+            event.acceptProposedAction()
+            return
         
         event.ignore()
@@ -1,12 +1,15 @@
 """Main window for Ollama Image Analyzer GUI."""
 
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction, QIcon, QKeySequence
+from PySide6.QtCore import QSignalBlocker, Qt, QThread, QTimer, Signal
+from PySide6.QtGui import QAction, QIcon, QKeySequence, QTextCursor
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -26,21 +29,23 @@ from PySide6.QtWidgets import (
     QStatusBar,
     QVBoxLayout,
     QWidget,
-    QTextEdit,
+    QPlainTextEdit,
 )
 
 from ollama_image_analyzer.core import (
     Config,
     OllamaAnalyzer,
     AnalysisResult,
+    ResultCache,
     get_config,
     save_config,
 )
+from ollama_image_analyzer import __version__
 from ollama_image_analyzer.resources import ICON_PATH
 from .image_viewer import ImageViewer
 from .prompt_editor import PromptEditor
 from .settings_dialog import SettingsDialog
-from .worker import AnalysisWorker
+from .worker import AnalysisWorker, ConnectionProbe
 from .batch_worker import BatchAnalysisWorker
 from .theme import DARK_THEME
 
@@ -50,14 +55,137 @@ logger = logging.getLogger(__name__)
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Emitted from the I/O pool when a single-image save finishes:
+    # saved file descriptions, error messages
+    _save_finished = Signal(list, list)
+    # Emitted from the I/O pool when a batch result's save finishes:
+    # image path, saved file kinds, error messages
+    _batch_save_finished = Signal(object, list, list)
+
+    # Seconds a connection probe result is reused for the same host
+    CONNECTION_CACHE_TTL = 5.0
+
+    # Seconds to wait on exit for cancelled analyses and probes to stop
+    SHUTDOWN_WAIT_SECONDS = 3.0
+
+    # Delay before small UI-driven config changes are written (ms)
+    CONFIG_SAVE_DELAY_MS = 500
+
+    # Minimum interval between "now analyzing" updates during a batch (ms)
+    BATCH_ITEM_UPDATE_MS = 100
+
+    # Minimum interval between batch average refreshes (ms)
+    BATCH_AVERAGES_UPDATE_MS = 250
+
+    # Speed metric styles, with and without a value
+    _STYLE_METRIC_OK = "color: #a6e3a1; font-weight: bold;"
+    _STYLE_METRIC_EMPTY = ""
+
+    # Output format checkbox stylesheet, for better visibility
+    _CHECKBOX_STYLE = """
+        QCheckBox {
+            spacing: 8px;
+            font-size: 13px;
+            font-weight: 500;
+        }
+        QCheckBox::indicator {
+            width: 22px;
+            height: 22px;
+            border-radius: 5px;
+            border: 2px solid #585b70;
+            background-color: #1e1e2e;
+        }
+        QCheckBox::indicator:hover {
+            border: 2px solid #89b4fa;
+            background-color: #313244;
+        }
+        QCheckBox::indicator:checked {
+            background-color: #a6e3a1;
+            border: 2px solid #a6e3a1;
+        }
+        QCheckBox::indicator:checked:hover {
+            background-color: #94e2a5;
+            border: 2px solid #94e2a5;
+        }
+        QCheckBox::indicator:unchecked {
+            background-color: #1e1e2e;
+            border: 2px solid #585b70;
+        }
+        QCheckBox::indicator:unchecked:hover {
+            background-color: #313244;
+            border: 2px solid #89b4fa;
+        }
+    """
+
+    # Presets whose output suits a YAML sidecar / image metadata
+    _YAML_PRESETS = frozenset({
+        "photoprism",           # Primary PhotoPrism integration
+        "museum_archive",       # Archival/cataloging
+        "stock_photography",    # Commercial stock libraries
+        "ecommerce",           # Product cataloging
+        "nft_metadata",        # NFT structured metadata
+    })
+    _EXIF_PRESETS = frozenset({
+        "photoprism",           # PhotoPrism can read EXIF
+        "museum_archive",       # Archival purposes
+        "stock_photography",    # Commercial metadata
+        "technical_photo_analysis",  # Photography metadata
+    })
+
     def __init__(self) -> None:
         """Initialize the main window."""
         super().__init__()
         
         self.config = get_config()
         self.analyzer: Optional[OllamaAnalyzer] = None
+        # Analyzers replaced while a thread was still using them; closed once
+        # nothing running holds them
+        self._retired_analyzers: List[OllamaAnalyzer] = []
         self.current_worker: Optional[AnalysisWorker] = None
+        # Cancelled workers still winding down; kept so their threads aren't
+        # destroyed while running
+        self._cancelled_workers: List[AnalysisWorker] = []
         self.batch_worker: Optional[BatchAnalysisWorker] = None
+        self.result_cache: Optional[ResultCache] = None  # Opened on first use
+        # Content digest of the last image analyzed, keyed by (path, mtime, size)
+        self._image_digest: Optional[tuple] = None  # (file id, digest)
+        self._pending_cache_key: Optional[str] = None  # Key for the running analysis
+        # Last connection probe: (monotonic time, host, connected, models)
+        self._connection_cache: tuple = (0.0, None, False, [])
+        self._connection_probe: Optional[ConnectionProbe] = None
+        # Last text/style set on each metric label, to skip redundant updates
+        self._metric_texts: Dict[QLabel, str] = {}
+        self._metric_styles: Dict[QLabel, str] = {}
+        # Folder listings for batches: folder -> (mtime_ns, sorted image paths)
+        self._dir_index_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+        
+        # Coalesce config writes from quick successive UI changes
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(self.CONFIG_SAVE_DELAY_MS)
+        self._config_save_timer.timeout.connect(self._flush_config)
+        # Throttle per-image batch updates; only the latest image is shown
+        self._latest_batch_item: Optional[Tuple[int, int, str, Path]] = None
+        self._batch_item_timer = QTimer(self)
+        self._batch_item_timer.setSingleShot(True)
+        self._batch_item_timer.setInterval(self.BATCH_ITEM_UPDATE_MS)
+        self._batch_item_timer.timeout.connect(self._show_latest_batch_item)
+        # Batch averages are recomputed once per interval, not per result
+        self._batch_averages_timer = QTimer(self)
+        self._batch_averages_timer.setSingleShot(True)
+        self._batch_averages_timer.setInterval(self.BATCH_AVERAGES_UPDATE_MS)
+        self._batch_averages_timer.timeout.connect(self._update_batch_average_metrics)
+        # Batch analysis pool, kept across batches; see _get_batch_executor()
+        self.batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_executor_size = 0
+        # Result files are written here rather than on the GUI thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="io")
+        self._save_finished.connect(self._on_save_finished)
+        self._batch_save_finished.connect(self._on_batch_save_finished)
+        # Batch saves still on the I/O pool, and the (processed, successful)
+        # counts of a batch whose summary waits for them
+        self._batch_saves_pending = 0
+        self._batch_finish_pending: Optional[Tuple[int, int]] = None
         self.batch_total_count: int = 0  # Track total for batch operations
         
         # Batch performance tracking
@@ -75,6 +203,12 @@ class MainWindow(QMainWindow):
         # Batch error tracking
         self.batch_failed_items: list[tuple[Path, str, str]] = []  # (path, filename, error_message)
         
+        # Output options, snapshotted when a batch starts
+        self._batch_write_yaml: bool = False
+        self._batch_write_exif: bool = False
+        self._batch_overwrite: bool = True
+        self._batch_output_dir: Optional[Path] = None
+        
         self._setup_ui()
         self._setup_menu()
         self._apply_theme()
@@ -132,7 +266,6 @@ class MainWindow(QMainWindow):
         status_panel_layout.addStretch()
         
         # Version label
-        from ollama_image_analyzer import __version__
         version_label = QLabel(f"v{__version__}")
         version_label.setStyleSheet("color: #6c7086; font-size: 11px;")
         status_panel_layout.addWidget(version_label)
@@ -179,7 +312,7 @@ class MainWindow(QMainWindow):
         response_group = QGroupBox("Response Preview")
         response_layout = QVBoxLayout(response_group)
         
-        self.response_preview = QTextEdit()
+        self.response_preview = QPlainTextEdit()
         self.response_preview.setReadOnly(True)
         self.response_preview.setPlaceholderText(
             "Analysis results will appear here...\n\n"
@@ -249,37 +382,10 @@ class MainWindow(QMainWindow):
         self.avg_label.setVisible(False)
         perf_layout.addWidget(self.avg_label)
         
-        # Create a grid for average metrics
-        avg_metrics_grid = QGridLayout()
-        avg_metrics_grid.setSpacing(8)
-        
-        # Average row 1: Tokens/sec and Total time
-        avg_metrics_grid.addWidget(QLabel("Avg Speed:"), 0, 0)
-        self.avg_tokens_per_sec_label = QLabel("—")
-        self.avg_tokens_per_sec_label.setObjectName("statusLabel")
-        avg_metrics_grid.addWidget(self.avg_tokens_per_sec_label, 0, 1)
-        
-        avg_metrics_grid.addWidget(QLabel("Avg Time:"), 0, 2)
-        self.avg_total_time_label = QLabel("—")
-        self.avg_total_time_label.setObjectName("statusLabel")
-        avg_metrics_grid.addWidget(self.avg_total_time_label, 0, 3)
-        
-        # Average row 2: Response tokens and Prompt tokens
-        avg_metrics_grid.addWidget(QLabel("Avg Response:"), 1, 0)
-        self.avg_response_tokens_label = QLabel("—")
-        self.avg_response_tokens_label.setObjectName("statusLabel")
-        avg_metrics_grid.addWidget(self.avg_response_tokens_label, 1, 1)
-        
-        avg_metrics_grid.addWidget(QLabel("Avg Prompt:"), 1, 2)
-        self.avg_prompt_tokens_label = QLabel("—")
-        self.avg_prompt_tokens_label.setObjectName("statusLabel")
-        avg_metrics_grid.addWidget(self.avg_prompt_tokens_label, 1, 3)
-        
-        avg_metrics_grid.setColumnStretch(1, 1)
-        avg_metrics_grid.setColumnStretch(3, 1)
-        
-        perf_layout.addLayout(avg_metrics_grid)
-        self.avg_metrics_grid_widget = avg_metrics_grid
+        # The average metrics grid is created on first use, see
+        # _ensure_avg_metrics_grid()
+        self.perf_layout = perf_layout
+        self._avg_metrics_grid: Optional[QGridLayout] = None
         right_layout.addWidget(perf_group)
         
         # Keep performance metrics visible (shows "—" until analysis runs)
@@ -289,45 +395,9 @@ class MainWindow(QMainWindow):
         # Output format checkboxes
         checkbox_row = QHBoxLayout()
         
-        # Custom checkbox stylesheet for better visibility
-        checkbox_style = """
-            QCheckBox {
-                spacing: 8px;
-                font-size: 13px;
-                font-weight: 500;
-            }
-            QCheckBox::indicator {
-                width: 22px;
-                height: 22px;
-                border-radius: 5px;
-                border: 2px solid #585b70;
-                background-color: #1e1e2e;
-            }
-            QCheckBox::indicator:hover {
-                border: 2px solid #89b4fa;
-                background-color: #313244;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #a6e3a1;
-                border: 2px solid #a6e3a1;
-            }
-            QCheckBox::indicator:checked:hover {
-                background-color: #94e2a5;
-                border: 2px solid #94e2a5;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #1e1e2e;
-                border: 2px solid #585b70;
-            }
-            QCheckBox::indicator:unchecked:hover {
-                background-color: #313244;
-                border: 2px solid #89b4fa;
-            }
-        """
-        
         # YAML sidecar checkbox
         self.write_yaml_checkbox = QCheckBox("✓ Write YAML sidecar")
-        self.write_yaml_checkbox.setStyleSheet(checkbox_style)
+        self.write_yaml_checkbox.setStyleSheet(self._CHECKBOX_STYLE)
         self.write_yaml_checkbox.setToolTip(
             "When enabled, creates PhotoPrism-compatible YAML sidecar files (.yml).\n"
             "These files contain structured metadata that photo management tools can read.\n"
@@ -339,7 +409,7 @@ class MainWindow(QMainWindow):
         
         # Metadata writing checkbox
         self.write_metadata_checkbox = QCheckBox("✓ Write to image metadata (EXIF/IPTC)")
-        self.write_metadata_checkbox.setStyleSheet(checkbox_style)
+        self.write_metadata_checkbox.setStyleSheet(self._CHECKBOX_STYLE)
         self.write_metadata_checkbox.setToolTip(
             "When enabled, writes the analysis result directly into the image file's EXIF/IPTC metadata fields.\n"
             "A .bak backup is created before modifying the original image.\n"
@@ -353,7 +423,7 @@ class MainWindow(QMainWindow):
         
         # Overwrite existing files checkbox
         self.overwrite_checkbox = QCheckBox("🔄 Overwrite existing files")
-        self.overwrite_checkbox.setStyleSheet(checkbox_style)
+        self.overwrite_checkbox.setStyleSheet(self._CHECKBOX_STYLE)
         self.overwrite_checkbox.setToolTip(
             "When enabled, new analyses will overwrite existing .txt and .yml files.\n"
             "When disabled, numbered versions will be created (file_1.txt, file_2.txt, etc.)"
@@ -462,17 +532,97 @@ class MainWindow(QMainWindow):
         """Save window geometry to config."""
         self.config.window_width = self.width()
         self.config.window_height = self.height()
+        # Also writes any change still waiting for the debounce timer
+        self._config_save_timer.stop()
         save_config()
     
-    def _update_analyzer(self) -> None:
-        """Update the Ollama analyzer with current configuration."""
-        self.analyzer = OllamaAnalyzer(
-            host=self.config.ollama_host,
-            model=self.config.ollama_model,
-            timeout=self.config.timeout_seconds,
-        )
+    def _schedule_config_save(self) -> None:
+        """Save the config once changes stop arriving for CONFIG_SAVE_DELAY_MS."""
+        self._config_save_timer.start()
+    
+    def _flush_config(self) -> None:
+        """Write the config to disk (debounce timer slot)."""
+        try:
+            save_config()
+        except Exception:
+            # Already logged by Config.save(); the next save retries
+            pass
+    
+    def _update_analyzer(self, refresh_connection: bool = True) -> None:
+        """
+        Update the Ollama analyzer with current configuration.
+        
+        Args:
+            refresh_connection: Re-check the server and its model list; not
+                needed when only the model changed.
+        """
+        previous = self.analyzer
+        
+        if (
+            previous is not None
+            and not self._running_workers()
+            and previous.host == self.config.ollama_host
+            and previous.timeout == self.config.timeout_seconds
+        ):
+            # Same server: keep the analyzer and its keep-alive connections
+            previous.model = self.config.ollama_model
+            previous.num_thread = self.config.num_thread
+        else:
+            self.analyzer = OllamaAnalyzer(
+                host=self.config.ollama_host,
+                model=self.config.ollama_model,
+                timeout=self.config.timeout_seconds,
+                num_thread=self.config.num_thread,
+            )
+            # A running worker may still hold the old analyzer; it is closed
+            # once the last thread using it finishes
+            if previous is not None:
+                self._retired_analyzers.append(previous)
+                self._close_retired_analyzers()
         logger.info(f"Analyzer configured: {self.config.ollama_host}, model={self.config.ollama_model}")
-        self._update_connection_status()
+        if refresh_connection:
+            self._update_connection_status()
+    
+    def _running_workers(self) -> List[QThread]:
+        """
+        Get the analysis workers whose threads are still running.
+        
+        Returns:
+            The running single-image and batch workers, including cancelled
+            single-image workers that are still winding down.
+        """
+        workers: List[QThread] = [
+            worker for worker in self._cancelled_workers if worker.isRunning()
+        ]
+        for worker in (self.current_worker, self.batch_worker):
+            if worker is not None and worker.isRunning():
+                workers.append(worker)
+        return workers
+    
+    def _close_retired_analyzers(self, finished: Optional[QThread] = None) -> None:
+        """
+        Close replaced analyzers that no running thread uses any more.
+        
+        Args:
+            finished: Worker whose completion is being handled; it is done
+                with its analyzer even if its thread hasn't exited yet.
+        """
+        if not self._retired_analyzers:
+            return
+        
+        in_use = [
+            worker.analyzer for worker in self._running_workers() if worker is not finished
+        ]
+        if self._connection_probe is not None and self._connection_probe.isRunning():
+            in_use.append(self._connection_probe.analyzer)
+        
+        still_used: List[OllamaAnalyzer] = []
+        for analyzer in self._retired_analyzers:
+            if any(analyzer is used for used in in_use):
+                still_used.append(analyzer)
+            else:
+                analyzer.close()
+        self._retired_analyzers = still_used
     
     def _update_status(self, message: str) -> None:
         """Update the status bar message."""
@@ -480,25 +630,9 @@ class MainWindow(QMainWindow):
     
     def _on_preset_changed(self, preset_name: str) -> None:
         """Handle preset change to show/hide output format checkboxes."""
-        # Define which presets support which output formats
-        yaml_presets = {
-            "photoprism",           # Primary PhotoPrism integration
-            "museum_archive",       # Archival/cataloging
-            "stock_photography",    # Commercial stock libraries
-            "ecommerce",           # Product cataloging
-            "nft_metadata",        # NFT structured metadata
-        }
-        
-        exif_presets = {
-            "photoprism",           # PhotoPrism can read EXIF
-            "museum_archive",       # Archival purposes
-            "stock_photography",    # Commercial metadata
-            "technical_photo_analysis",  # Photography metadata
-        }
-        
         # Show/hide checkboxes based on preset
-        show_yaml = preset_name in yaml_presets
-        show_exif = preset_name in exif_presets
+        show_yaml = preset_name in self._YAML_PRESETS
+        show_exif = preset_name in self._EXIF_PRESETS
         
         self.write_yaml_checkbox.setVisible(show_yaml)
         self.write_metadata_checkbox.setVisible(show_exif)
@@ -510,23 +644,61 @@ class MainWindow(QMainWindow):
     def _on_overwrite_checkbox_changed(self) -> None:
         """Handle overwrite checkbox change to sync with config."""
         self.config.overwrite_existing_files = self.overwrite_checkbox.isChecked()
-        save_config()
+        self._schedule_config_save()
     
     def _update_connection_status(self) -> None:
-        """Update the connection status display."""
+        """
+        Update the connection status display.
+        
+        The server is probed on a background thread; a result less than
+        CONNECTION_CACHE_TTL seconds old for the same host is reused instead.
+        """
         if self.analyzer is None:
             self.connection_status.setText("⚫ Disconnected")
             self.model_selector.clear()
             self.model_selector.setEnabled(False)
             return
         
-        # Test connection
-        connected = self.analyzer.test_connection()
+        host = self.analyzer.host
+        checked_at, cached_host, connected, models = self._connection_cache
+        if cached_host == host and time.monotonic() - checked_at < self.CONNECTION_CACHE_TTL:
+            self._apply_connection_result(host, connected, models)
+            return
+        
+        if self._connection_probe is not None:
+            # Its result is applied only if it is still for the current host;
+            # otherwise _apply_connection_result starts a new probe
+            return
+        
+        self.connection_status.setText("🟡 Connecting...")
+        self.connection_status.setStyleSheet("color: #f9e2af;")
+        # Parented so a probe still running when it's dropped isn't destroyed
+        self._connection_probe = ConnectionProbe(self.analyzer, self)
+        self._connection_probe.probed.connect(self._apply_connection_result)
+        self._connection_probe.finished.connect(self._connection_probe.deleteLater)
+        self._connection_probe.start()
+    
+    def _apply_connection_result(self, host: str, connected: bool, models: List[str]) -> None:
+        """
+        Show the outcome of a connection probe.
+        
+        Args:
+            host: Host that was probed.
+            connected: Whether the server answered.
+            models: Models available on the server.
+        """
+        self._connection_probe = None
+        self._close_retired_analyzers()
+        self._connection_cache = (time.monotonic(), host, connected, models)
+        if self.analyzer is None or host != self.analyzer.host:
+            # The host changed while this probe was running
+            self._update_connection_status()
+            return
         
         if connected:
             self.connection_status.setText("🟢 Connected")
             self.connection_status.setStyleSheet("color: #a6e3a1;")
-            self._populate_model_list()
+            self._populate_model_list(models)
             self.model_selector.setEnabled(True)
         else:
             self.connection_status.setText("🔴 Disconnected")
@@ -535,19 +707,21 @@ class MainWindow(QMainWindow):
             self.model_selector.addItem(self.config.ollama_model)
             self.model_selector.setEnabled(False)
     
-    def _populate_model_list(self) -> None:
-        """Populate the model selector with available models."""
-        try:
-            models = self.analyzer.list_models()
-            
-            # Block signals while updating
-            self.model_selector.blockSignals(True)
+    def _populate_model_list(self, models: List[str]) -> None:
+        """
+        Populate the model selector with available models.
+        
+        Args:
+            models: Model names reported by the server.
+        """
+        # Block signals while updating
+        with QSignalBlocker(self.model_selector):
             self.model_selector.clear()
-            
+        
             # Add all available models
             for model in models:
                 self.model_selector.addItem(model)
-            
+        
             # Select current model
             current_index = self.model_selector.findText(self.config.ollama_model)
             if current_index >= 0:
@@ -556,16 +730,6 @@ class MainWindow(QMainWindow):
                 # If current model not in list, add it and select it
                 self.model_selector.addItem(self.config.ollama_model)
                 self.model_selector.setCurrentText(self.config.ollama_model)
-            
-            self.model_selector.blockSignals(False)
-            
-        except Exception as e:
-            logger.error(f"Failed to list models: {e}")
-            # Fall back to just showing the current model
-            self.model_selector.blockSignals(True)
-            self.model_selector.clear()
-            self.model_selector.addItem(self.config.ollama_model)
-            self.model_selector.blockSignals(False)
     
     def _on_model_changed(self, model_name: str) -> None:
         """Handle model selection change."""
@@ -574,10 +738,10 @@ class MainWindow(QMainWindow):
         
         # Update config
         self.config.ollama_model = model_name
-        save_config()
+        self._schedule_config_save()
         
-        # Update analyzer
-        self._update_analyzer()
+        # Update analyzer; the server and its model list are unchanged
+        self._update_analyzer(refresh_connection=False)
         
         self._update_status(f"Switched to model: {model_name}")
         logger.info(f"Model changed to: {model_name}")
@@ -594,7 +758,7 @@ class MainWindow(QMainWindow):
         if file_path:
             path = Path(file_path)
             self.config.last_image_directory = str(path.parent)
-            save_config()
+            self._schedule_config_save()
             
             self.image_viewer.load_image(path)
     
@@ -620,12 +784,7 @@ class MainWindow(QMainWindow):
             return
         
         # Check for existing output file
-        if self.config.output_directory:
-            base_output = Path(self.config.output_directory) / self.image_viewer.current_image.stem
-        else:
-            base_output = self.image_viewer.current_image.with_suffix("")
-        
-        txt_path = Path(str(base_output) + ".txt")
+        txt_path = self._txt_output_path(self.image_viewer.current_image, self.config.output_directory)
         
         if txt_path.exists():
             if not self.overwrite_checkbox.isChecked():
@@ -652,6 +811,37 @@ class MainWindow(QMainWindow):
                 if reply != QMessageBox.StandardButton.Yes:
                     return
         
+        # Offer the result of an earlier analysis of the same image content
+        # with the same prompt and model; the user can still ask for a new one
+        self._pending_cache_key = None
+        image_data: Optional[bytes] = None
+        result_cache = self._get_result_cache()
+        if result_cache is not None and self.analyzer is not None:
+            image_path = self.image_viewer.current_image
+            try:
+                digest, image_data = self._current_image_digest(image_path, result_cache)
+                self._pending_cache_key = ResultCache.make_key_for_digest(
+                    digest, prompt, self.analyzer.model
+                )
+            except OSError as e:
+                logger.warning(f"Could not hash {image_path.name} for the result cache: {e}")
+            else:
+                cached = result_cache.get(self._pending_cache_key, image_path)
+                if cached is not None:
+                    reply = QMessageBox.question(
+                        self,
+                        "Use Cached Result?",
+                        f"{image_path.name} was already analyzed with this prompt and model.\n\n"
+                        "Use the stored result instead of analyzing it again?",
+                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                        QMessageBox.StandardButton.Yes
+                    )
+                    if reply == QMessageBox.StandardButton.Yes:
+                        logger.info(f"Using cached result for {image_path.name}")
+                        self._pending_cache_key = None
+                        self._on_analysis_finished(cached)
+                        return
+        
         # Disable UI during analysis
         self.analyze_button.setEnabled(False)
         self.import_button.setEnabled(False)
@@ -661,20 +851,73 @@ class MainWindow(QMainWindow):
         self.progress_bar.setRange(0, 0)  # Indeterminate
         self.progress_bar.setFormat("Analyzing...")
         
+        # The response is streamed into the preview as it is generated
+        self.response_preview.clear()
+        
         # Create and start worker
         self.current_worker = AnalysisWorker(
             self.image_viewer.current_image,
             prompt,
-            self.analyzer
+            self.analyzer,
+            image_data=image_data,
         )
         
         self.current_worker.started.connect(self._on_analysis_started)
         self.current_worker.progress.connect(self._on_analysis_progress)
+        self.current_worker.text_received.connect(self._on_analysis_text)
         self.current_worker.error.connect(self._on_analysis_error)
         self.current_worker.finished.connect(self._on_analysis_finished)
         
         self.current_worker.start()
     
+    def _get_result_cache(self) -> Optional[ResultCache]:
+        """
+        Get the result cache, opening it on first use.
+        
+        Returns:
+            The cache, or None if caching is disabled or it can't be opened.
+        """
+        if not self.config.cache_results:
+            return None
+        if self.result_cache is None:
+            try:
+                self.result_cache = ResultCache(self.config.result_cache_file)
+            except Exception as e:
+                logger.warning(f"Result cache unavailable: {e}")
+        return self.result_cache
+    
+    def _current_image_digest(
+        self, image_path: Path, result_cache: ResultCache
+    ) -> Tuple[str, Optional[bytes]]:
+        """
+        Get the content digest of an image, reusing it while the file is unchanged.
+        
+        The bytes read to hash the image are handed to the analysis worker, so
+        the file is read once per analysis rather than once for the hash and
+        again for the request. Only the digest is kept afterwards.
+        
+        Args:
+            image_path: Path to the image.
+            result_cache: Cache holding digests of images hashed in earlier runs.
+        
+        Returns:
+            Digest from ResultCache.image_digest() and the image contents, or
+            None for the contents if the digest was known without reading them.
+        """
+        stat = image_path.stat()
+        file_id = (image_path, stat.st_mtime_ns, stat.st_size)
+        if self._image_digest is not None and self._image_digest[0] == file_id:
+            return self._image_digest[1], None
+        
+        digest = result_cache.lookup_digest(image_path, stat)
+        image_data = None
+        if digest is None:
+            image_data = OllamaAnalyzer.read_image(image_path)
+            digest = ResultCache.image_digest(image_data)
+            result_cache.store_digest(image_path, stat, digest)
+        self._image_digest = (file_id, digest)
+        return digest, image_data
+    
     def _on_analysis_started(self) -> None:
         """Handle analysis started."""
         self._update_status("Analyzing image...")
@@ -683,6 +926,13 @@ class MainWindow(QMainWindow):
         """Handle analysis progress update."""
         self._update_status(message)
     
+    def _on_analysis_text(self, text: str) -> None:
+        """Append streamed response text to the preview."""
+        # Insert at the end of the current line; appendPlainText() would
+        # start a new paragraph for every chunk
+        self.response_preview.moveCursor(QTextCursor.MoveOperation.End)
+        self.response_preview.insertPlainText(text)
+    
     def _on_analysis_error(self, error: str) -> None:
         """Handle analysis error."""
         logger.error(f"Analysis error: {error}")
@@ -694,6 +944,8 @@ class MainWindow(QMainWindow):
     
     def _on_analysis_finished(self, result: AnalysisResult) -> None:
         """Handle analysis completion."""
+        self._close_retired_analyzers(finished=self.current_worker)
+        
         # Re-enable UI
         self.analyze_button.setEnabled(True)
         self.import_button.setEnabled(True)
@@ -703,162 +955,287 @@ class MainWindow(QMainWindow):
         self.progress_bar.setFormat("%p% - %v/%m")
         
         if result.success:
+            if self._pending_cache_key is not None and self.result_cache is not None:
+                self.result_cache.put(self._pending_cache_key, result)
+            
             # Show preview
             self.response_preview.setPlainText(result.response)
             
             # Update performance metrics
             self._update_performance_metrics(result)
             
-            # Save result
-            saved_files = []
-            errors = []
+            # Save result on the I/O pool; EXIF rewrites of large JPEGs would
+            # otherwise freeze the window. Widget state is read here, on the
+            # GUI thread, and the outcome comes back through _save_finished
+            self._update_status("Saving results...")
+            self._io_pool.submit(
+                self._persist_result,
+                result,
+                self.write_yaml_checkbox.isVisible() and self.write_yaml_checkbox.isChecked(),
+                self.write_metadata_checkbox.isVisible() and self.write_metadata_checkbox.isChecked(),
+                self.overwrite_checkbox.isChecked(),
+            )
+        else:
+            self._update_status("Analysis failed")
+    
+    @staticmethod
+    def _txt_output_path(image_path: Path, output_dir: Optional[Union[str, Path]]) -> Path:
+        """
+        Get the path of the .txt file an image's result is saved to.
+        
+        Args:
+            image_path: Path to the analyzed image.
+            output_dir: Output directory (None or empty = next to the image).
+        
+        Returns:
+            Path to the .txt file.
+        """
+        return Path(output_dir or image_path.parent) / f"{image_path.stem}.txt"
+    
+    def _persist_result(
+        self,
+        result: AnalysisResult,
+        write_yaml: bool,
+        write_metadata: bool,
+        overwrite: bool,
+    ) -> None:
+        """
+        Save an analysis result to disk (runs on the I/O pool).
+        
+        Writes the YAML sidecar, the .txt file and optionally the image
+        metadata, then emits _save_finished with what was saved.
+        
+        Args:
+            result: Successful analysis result to save.
+            write_yaml: Whether to write the YAML sidecar.
+            write_metadata: Whether to write the description into the image.
+            overwrite: Whether to overwrite existing output files.
+        """
+        saved_files = []
+        errors = []
+        
+        try:
+            # Determine output path
+            txt_path = self._txt_output_path(result.image_path, self.config.output_directory)
             
-            try:
-                # Determine output path
-                if self.config.output_directory:
-                    base_output = Path(self.config.output_directory) / result.image_path.stem
-                else:
-                    base_output = result.image_path.with_suffix("")
-                
-                # Save YAML sidecar (PhotoPrism compatible)
-                if self.write_yaml_checkbox.isVisible() and self.write_yaml_checkbox.isChecked():
-                    try:
-                        yaml_path = self.analyzer.save_yaml_sidecar(result, result.image_path, overwrite=self.overwrite_checkbox.isChecked())
-                        saved_files.append(f"YAML: {yaml_path.name}")
-                    except ValueError as e:
-                        # Validation error
-                        errors.append(f"YAML (validation failed): {str(e)}")
-                        logger.error(f"Validation failed: {e}")
-                    except Exception as e:
-                        errors.append(f"YAML sidecar: {str(e)}")
-                        logger.error(f"Failed to save YAML sidecar: {e}")
-                
-                # Save .txt file (for backward compatibility)
+            # Save YAML sidecar (PhotoPrism compatible)
+            if write_yaml:
                 try:
-                    txt_path = self.analyzer.save_result(result, Path(str(base_output) + ".txt"), overwrite=self.overwrite_checkbox.isChecked())
-                    saved_files.append(f"Text: {txt_path.name}")
+                    yaml_path = self.analyzer.save_yaml_sidecar(result, result.image_path, overwrite=overwrite)
+                    saved_files.append(f"YAML: {yaml_path.name}")
                 except ValueError as e:
                     # Validation error
-                    errors.append(f"Text file (validation failed): {str(e)}")
+                    errors.append(f"YAML (validation failed): {str(e)}")
                     logger.error(f"Validation failed: {e}")
                 except Exception as e:
-                    errors.append(f"Text file: {str(e)}")
-                    logger.error(f"Failed to save text file: {e}")
-                
-                # Optionally write to image metadata
-                if self.write_metadata_checkbox.isVisible() and self.write_metadata_checkbox.isChecked():
-                    try:
-                        if self.analyzer.write_to_image_metadata(result, result.image_path):
-                            saved_files.append("EXIF metadata")
-                        else:
-                            errors.append("EXIF metadata: write failed")
-                    except Exception as e:
-                        errors.append(f"EXIF metadata: {str(e)}")
-                        logger.error(f"Failed to write image metadata: {e}")
-                
-                # Show status
-                if saved_files:
-                    self._update_status(f"✓ Analysis complete! Saved: {', '.join(saved_files)}")
-                    
-                    message = "Analysis successful!\n\n" + "Saved files:\n" + "\n".join(f"• {f}" for f in saved_files)
-                    if errors:
-                        message += "\n\nErrors:\n" + "\n".join(f"• {e}" for e in errors)
-                    
-                    QMessageBox.information(
-                        self,
-                        "Analysis Complete",
-                        message
-                    )
-                else:
-                    raise Exception("All save operations failed")
+                    errors.append(f"YAML sidecar: {str(e)}")
+                    logger.error(f"Failed to save YAML sidecar: {e}")
             
+            # Save .txt file (for backward compatibility)
+            try:
+                txt_path = self.analyzer.save_result(result, txt_path, overwrite=overwrite)
+                saved_files.append(f"Text: {txt_path.name}")
+            except ValueError as e:
+                # Validation error
+                errors.append(f"Text file (validation failed): {str(e)}")
+                logger.error(f"Validation failed: {e}")
             except Exception as e:
-                logger.error(f"Failed to save result: {e}")
-                QMessageBox.warning(
-                    self,
-                    "Save Error",
-                    f"Analysis completed but failed to save:\n{str(e)}\n\n"
-                    "You can copy the text from the preview."
-                )
+                errors.append(f"Text file: {str(e)}")
+                logger.error(f"Failed to save text file: {e}")
+            
+            # Optionally write to image metadata
+            if write_metadata:
+                try:
+                    if self.analyzer.write_to_image_metadata(result, result.image_path):
+                        saved_files.append("EXIF metadata")
+                    else:
+                        errors.append("EXIF metadata: write failed")
+                except Exception as e:
+                    errors.append(f"EXIF metadata: {str(e)}")
+                    logger.error(f"Failed to write image metadata: {e}")
+        
+        except Exception as e:
+            logger.error(f"Failed to save result: {e}")
+            errors.append(str(e))
+        
+        self._save_finished.emit(saved_files, errors)
+    
+    def _on_save_finished(self, saved_files: List[str], errors: List[str]) -> None:
+        """Report the outcome of _persist_result on the GUI thread."""
+        if saved_files:
+            self._update_status(f"✓ Analysis complete! Saved: {', '.join(saved_files)}")
+            
+            message = "Analysis successful!\n\n" + "Saved files:\n" + "\n".join(f"• {f}" for f in saved_files)
+            if errors:
+                message += "\n\nErrors:\n" + "\n".join(f"• {e}" for e in errors)
+            
+            QMessageBox.information(
+                self,
+                "Analysis Complete",
+                message
+            )
         else:
-            self._update_status("Analysis failed")
+            logger.error("Failed to save result: All save operations failed")
+            self._update_status("Failed to save results")
+            QMessageBox.warning(
+                self,
+                "Save Error",
+                "Analysis completed but failed to save:\nAll save operations failed\n\n"
+                "You can copy the text from the preview."
+            )
     
     def _update_performance_metrics(self, result: AnalysisResult) -> None:
         """Update the performance metrics display with analysis results."""
         # Performance panel is always visible, just update the values
-        
-        # Update tokens per second
-        if result.tokens_per_second:
-            self.tokens_per_sec_label.setText(f"{result.tokens_per_second:.2f} tok/s")
-            self.tokens_per_sec_label.setStyleSheet("color: #a6e3a1; font-weight: bold;")
-        else:
-            self.tokens_per_sec_label.setText("—")
-            self.tokens_per_sec_label.setStyleSheet("")
-        
-        # Update total time
-        if result.total_seconds:
-            self.total_time_label.setText(f"{result.total_seconds:.2f}s")
-        else:
-            self.total_time_label.setText("—")
-        
-        # Update response tokens
-        if result.eval_count:
-            self.response_tokens_label.setText(f"{result.eval_count} tokens")
-        else:
-            self.response_tokens_label.setText("—")
-        
-        # Update prompt tokens
-        if result.prompt_eval_count:
-            self.prompt_tokens_label.setText(f"{result.prompt_eval_count} tokens")
-        else:
-            self.prompt_tokens_label.setText("—")
-        
-        # Update eval time
-        if result.eval_duration:
-            eval_seconds = result.eval_duration / 1_000_000_000
-            self.eval_time_label.setText(f"{eval_seconds:.2f}s")
-        else:
-            self.eval_time_label.setText("—")
-        
-        # Update load time
-        if result.load_duration:
-            load_seconds = result.load_duration / 1_000_000_000
-            self.load_time_label.setText(f"{load_seconds:.2f}s")
-        else:
-            self.load_time_label.setText("—")
+        eval_seconds = result.eval_duration / 1_000_000_000 if result.eval_duration else 0
+        load_seconds = result.load_duration / 1_000_000_000 if result.load_duration else 0
+        
+        with self._batched_gui(self.perf_group):
+            self._set_metric_labels({
+                self.tokens_per_sec_label: f"{result.tokens_per_second:.2f} tok/s" if result.tokens_per_second else "—",
+                self.total_time_label: f"{result.total_seconds:.2f}s" if result.total_seconds else "—",
+                self.response_tokens_label: f"{result.eval_count} tokens" if result.eval_count else "—",
+                self.prompt_tokens_label: f"{result.prompt_eval_count} tokens" if result.prompt_eval_count else "—",
+                self.eval_time_label: f"{eval_seconds:.2f}s" if eval_seconds else "—",
+                self.load_time_label: f"{load_seconds:.2f}s" if load_seconds else "—",
+            })
+            self._set_metric_style(
+                self.tokens_per_sec_label,
+                self._STYLE_METRIC_OK if result.tokens_per_second else self._STYLE_METRIC_EMPTY,
+            )
     
     def _update_batch_average_metrics(self) -> None:
         """Update the batch average metrics display."""
         if self.batch_metrics_count == 0:
             return
         
+        self._ensure_avg_metrics_grid()
+        
         # Calculate average tokens per second
         if self.batch_total_eval_duration > 0:
             avg_eval_seconds = self.batch_total_eval_duration / 1_000_000_000
-            avg_tokens_per_sec = self.batch_total_tokens / avg_eval_seconds
-            self.avg_tokens_per_sec_label.setText(f"{avg_tokens_per_sec:.2f} tok/s")
-            self.avg_tokens_per_sec_label.setStyleSheet("color: #a6e3a1; font-weight: bold;")
+            avg_tokens_per_sec = f"{self.batch_total_tokens / avg_eval_seconds:.2f} tok/s"
         else:
-            self.avg_tokens_per_sec_label.setText("—")
-            self.avg_tokens_per_sec_label.setStyleSheet("")
+            avg_tokens_per_sec = "—"
         
         # Calculate average total time
         if self.batch_total_duration > 0:
             avg_total_seconds = (self.batch_total_duration / 1_000_000_000) / self.batch_metrics_count
-            self.avg_total_time_label.setText(f"{avg_total_seconds:.2f}s")
+            avg_total_time = f"{avg_total_seconds:.2f}s"
         else:
-            self.avg_total_time_label.setText("—")
+            avg_total_time = "—"
         
-        # Calculate average response tokens
+        # Calculate average response and prompt tokens
         avg_response_tokens = self.batch_total_tokens / self.batch_metrics_count
-        self.avg_response_tokens_label.setText(f"{avg_response_tokens:.1f} tokens")
-        
-        # Calculate average prompt tokens
         if self.batch_total_prompt_tokens > 0:
-            avg_prompt_tokens = self.batch_total_prompt_tokens / self.batch_metrics_count
-            self.avg_prompt_tokens_label.setText(f"{avg_prompt_tokens:.1f} tokens")
+            avg_prompt_tokens = f"{self.batch_total_prompt_tokens / self.batch_metrics_count:.1f} tokens"
         else:
-            self.avg_prompt_tokens_label.setText("—")
+            avg_prompt_tokens = "—"
+        
+        with self._batched_gui(self.perf_group):
+            self._set_metric_labels({
+                self.avg_tokens_per_sec_label: avg_tokens_per_sec,
+                self.avg_total_time_label: avg_total_time,
+                self.avg_response_tokens_label: f"{avg_response_tokens:.1f} tokens",
+                self.avg_prompt_tokens_label: avg_prompt_tokens,
+            })
+            self._set_metric_style(
+                self.avg_tokens_per_sec_label,
+                self._STYLE_METRIC_OK if self.batch_total_eval_duration > 0 else self._STYLE_METRIC_EMPTY,
+            )
+    
+    def _ensure_avg_metrics_grid(self) -> None:
+        """Create the batch average metrics grid the first time it is needed."""
+        if self._avg_metrics_grid is not None:
+            return
+        
+        # Create a grid for average metrics
+        avg_metrics_grid = QGridLayout()
+        avg_metrics_grid.setSpacing(8)
+        
+        # Average row 1: Tokens/sec and Total time
+        avg_metrics_grid.addWidget(QLabel("Avg Speed:"), 0, 0)
+        self.avg_tokens_per_sec_label = QLabel("—")
+        self.avg_tokens_per_sec_label.setObjectName("statusLabel")
+        avg_metrics_grid.addWidget(self.avg_tokens_per_sec_label, 0, 1)
+        
+        avg_metrics_grid.addWidget(QLabel("Avg Time:"), 0, 2)
+        self.avg_total_time_label = QLabel("—")
+        self.avg_total_time_label.setObjectName("statusLabel")
+        avg_metrics_grid.addWidget(self.avg_total_time_label, 0, 3)
+        
+        # Average row 2: Response tokens and Prompt tokens
+        avg_metrics_grid.addWidget(QLabel("Avg Response:"), 1, 0)
+        self.avg_response_tokens_label = QLabel("—")
+        self.avg_response_tokens_label.setObjectName("statusLabel")
+        avg_metrics_grid.addWidget(self.avg_response_tokens_label, 1, 1)
+        
+        avg_metrics_grid.addWidget(QLabel("Avg Prompt:"), 1, 2)
+        self.avg_prompt_tokens_label = QLabel("—")
+        self.avg_prompt_tokens_label.setObjectName("statusLabel")
+        avg_metrics_grid.addWidget(self.avg_prompt_tokens_label, 1, 3)
+        
+        avg_metrics_grid.setColumnStretch(1, 1)
+        avg_metrics_grid.setColumnStretch(3, 1)
+        
+        self.perf_layout.addLayout(avg_metrics_grid)
+        self._avg_metrics_grid = avg_metrics_grid
+    
+    @contextmanager
+    def _batched_gui(self, widget: QWidget) -> Iterator[None]:
+        """
+        Suspend repaints of a widget while several of its children change.
+        
+        Args:
+            widget: Widget to repaint once, when the block exits.
+        """
+        widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            # Re-enabling updates schedules the repaint
+            widget.setUpdatesEnabled(True)
+    
+    def _set_metric_labels(self, texts: Dict[QLabel, str]) -> None:
+        """
+        Set metric label texts, skipping labels whose text is unchanged.
+        
+        Args:
+            texts: New text for each label.
+        """
+        for label, text in texts.items():
+            if self._metric_texts.get(label) != text:
+                label.setText(text)
+                self._metric_texts[label] = text
+    
+    def _set_metric_style(self, label: QLabel, style: str) -> None:
+        """Apply a metric label style, skipping Qt's CSS re-parse if unchanged."""
+        if self._metric_styles.get(label, self._STYLE_METRIC_EMPTY) != style:
+            label.setStyleSheet(style)
+            self._metric_styles[label] = style
+    
+    def _scan_images(self, folder: Path) -> List[Path]:
+        """
+        List the supported images in a folder, reusing the last listing.
+        
+        Adding, removing or renaming a file updates the folder's mtime, so an
+        unchanged mtime means the previous listing is still accurate.
+        
+        Args:
+            folder: Folder to scan (not recursive).
+        
+        Returns:
+            Paths of the supported images, sorted by name.
+        """
+        mtime_ns = folder.stat().st_mtime_ns
+        cached = self._dir_index_cache.get(folder)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+        
+        # Single directory pass, no per-entry stat
+        image_paths = sorted(OllamaAnalyzer.iter_supported(folder))
+        self._dir_index_cache[folder] = (mtime_ns, image_paths)
+        return list(image_paths)
     
     def _batch_analyze_folder(self) -> None:
         """Start batch analysis of all images in a folder."""
@@ -875,16 +1252,10 @@ class MainWindow(QMainWindow):
         
         folder = Path(folder_path)
         self.config.last_image_directory = str(folder)
-        save_config()
-        
-        # Find all images in folder
-        image_paths = []
-        for ext in OllamaAnalyzer.SUPPORTED_FORMATS:
-            image_paths.extend(folder.glob(f"*{ext}"))
-            image_paths.extend(folder.glob(f"*{ext.upper()}"))
+        self._schedule_config_save()
         
-        # Sort by name
-        image_paths = sorted(set(image_paths))
+        # Find all images in folder, sorted by name
+        image_paths = self._scan_images(folder)
         
         if not image_paths:
             QMessageBox.information(
@@ -895,20 +1266,21 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Check for existing output files
+        # Check for existing output files. Every .txt goes in the same
+        # directory, so one listing replaces a stat per image
+        output_dir = Path(self.config.output_directory) if self.config.output_directory else folder
+        try:
+            existing_names = {os.path.normcase(name) for name in os.listdir(output_dir)}
+        except OSError:
+            existing_names = set()
         existing_files = []
         images_to_process = []
         
         for img_path in image_paths:
-            if self.config.output_directory:
-                base_output = Path(self.config.output_directory) / img_path.stem
-            else:
-                base_output = img_path.with_suffix("")
-            
-            txt_path = Path(str(base_output) + ".txt")
+            txt_name = img_path.stem + ".txt"
             
-            if txt_path.exists():
-                existing_files.append(txt_path.name)
+            if os.path.normcase(txt_name) in existing_names:
+                existing_files.append(txt_name)
                 if self.overwrite_checkbox.isChecked():
                     images_to_process.append(img_path)
             else:
@@ -992,14 +1364,17 @@ class MainWindow(QMainWindow):
         self.batch_worker = BatchAnalysisWorker(
             image_paths,
             prompt,
-            self.analyzer
+            self.analyzer,
+            max_workers=self.config.batch_concurrency,
+            # Reuse results for images analyzed before with the same prompt and model
+            result_cache=self._get_result_cache(),
+            executor=self._get_batch_executor(),
         )
         
         self.batch_worker.started.connect(self._on_batch_started)
         self.batch_worker.item_started.connect(self._on_batch_item_started)
-        self.batch_worker.item_finished.connect(self._on_batch_item_finished)
+        self.batch_worker.items_batch_finished.connect(self._on_batch_items_finished)
         self.batch_worker.item_retry.connect(self._on_batch_item_retry)
-        self.batch_worker.progress.connect(self._on_batch_progress)
         self.batch_worker.error.connect(self._on_batch_error)
         self.batch_worker.finished.connect(self._on_batch_finished)
         self.batch_worker.paused.connect(self._on_batch_paused)
@@ -1007,6 +1382,25 @@ class MainWindow(QMainWindow):
         
         self.batch_worker.start()
     
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool batches run on, creating it on first use.
+        
+        The pool (and its threads) is reused by later batches; it is only
+        replaced when the batch concurrency setting has changed.
+        
+        Returns:
+            Executor with config.batch_concurrency worker threads.
+        """
+        size = max(1, self.config.batch_concurrency)
+        if self.batch_executor is None or self._batch_executor_size != size:
+            if self.batch_executor is not None:
+                # Only called between batches, so the old pool is idle
+                self.batch_executor.shutdown(wait=False)
+            self.batch_executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="batch")
+            self._batch_executor_size = size
+        return self.batch_executor
+    
     def _on_batch_started(self) -> None:
         """Handle batch analysis started."""
         self._update_status("Starting batch analysis...")
@@ -1028,21 +1422,46 @@ class MainWindow(QMainWindow):
         # Reset error tracking
         self.batch_failed_items = []
         
+        # Results are saved with the output options as they were when the
+        # batch started, so the widgets are read once rather than per result
+        self._batch_write_yaml = self.write_yaml_checkbox.isVisible() and self.write_yaml_checkbox.isChecked()
+        self._batch_write_exif = (
+            self.write_metadata_checkbox.isVisible() and self.write_metadata_checkbox.isChecked()
+        )
+        self._batch_overwrite = self.overwrite_checkbox.isChecked()
+        output_directory = self.config.output_directory
+        self._batch_output_dir = Path(output_directory) if output_directory else None
+        
         # Show average section (performance panel already visible)
         self.avg_label.setVisible(True)
     
     def _on_batch_item_started(self, current: int, total: int, filename: str, image_path: Path) -> None:
-        """Handle batch item started."""
-        # Update progress bar with ETA
-        self._update_batch_progress_with_eta(current - 1, total)
+        """
+        Handle batch item started.
+        
+        Cached images can start hundreds of times a second, so the first
+        image is shown at once and later ones at most every
+        BATCH_ITEM_UPDATE_MS, skipping straight to the most recent.
+        """
+        self._latest_batch_item = (current, total, filename, image_path)
+        if not self._batch_item_timer.isActive():
+            self._show_latest_batch_item()
+    
+    def _show_latest_batch_item(self) -> None:
+        """Show the most recently started batch item, if not shown yet."""
+        if self._latest_batch_item is None:
+            return
+        current, total, filename, image_path = self._latest_batch_item
+        self._latest_batch_item = None
+        self._batch_item_timer.start()
+        
+        # Update progress bar with ETA (several items can be in flight, so
+        # progress follows completions rather than the item's position)
+        self._update_batch_progress_with_eta(self.batch_completed_count, total)
         self._update_status(f"Analyzing {current}/{total}: {filename}")
         
-        # Load and display the current image
-        try:
-            self.image_viewer.load_image(image_path)
-            logger.debug(f"Loaded batch image: {filename}")
-        except Exception as e:
-            logger.error(f"Failed to load batch image {filename}: {e}")
+        # Display the current image; it is decoded off the GUI thread
+        self.image_viewer.load_image_async(image_path)
     
     def _on_batch_item_retry(self, filename: str, error_msg: str) -> None:
         """Handle batch item retry notification."""
@@ -1050,6 +1469,12 @@ class MainWindow(QMainWindow):
         self._update_status(f"⚠️ Retrying {filename} (failed: {short_error})")
         logger.info(f"Retrying {filename} after failure: {error_msg}")
     
+    def _on_batch_items_finished(self, results: List[AnalysisResult]) -> None:
+        """Handle a chunk of finished batch items with a single repaint."""
+        with self._batched_gui(self):
+            for result in results:
+                self._on_batch_item_finished(result)
+    
     def _on_batch_item_finished(self, result: AnalysisResult) -> None:
         """Handle batch item finished."""
         # Update completion count and ETA
@@ -1057,93 +1482,133 @@ class MainWindow(QMainWindow):
         self._update_batch_progress_with_eta(self.batch_completed_count, self.batch_total_count)
         
         if result.success:
-            # Save the result next to the image
-            saved_files = []
-            save_errors = []
+            # Save the result next to the image on the I/O pool, so EXIF
+            # rewrites and disk writes overlap the next analyses instead of
+            # blocking the window; the outcome comes back via _batch_save_finished
+            self._batch_saves_pending += 1
+            self._io_pool.submit(
+                self._save_batch_result,
+                result,
+                self._batch_output_dir,
+                self._batch_write_yaml,
+                self._batch_write_exif,
+                self._batch_overwrite,
+            )
             
-            try:
-                # Determine output base path
-                if self.config.output_directory:
-                    base_output = Path(self.config.output_directory) / result.image_path.stem
-                else:
-                    base_output = result.image_path.with_suffix("")
-                
-                # Save YAML sidecar (PhotoPrism compatible)
-                if self.write_yaml_checkbox.isVisible() and self.write_yaml_checkbox.isChecked():
-                    try:
-                        yaml_path = self.analyzer.save_yaml_sidecar(result, result.image_path, overwrite=self.overwrite_checkbox.isChecked())
-                        saved_files.append("YAML")
-                    except ValueError as e:
-                        # Validation error - this is critical
-                        save_errors.append(f"YAML validation: {str(e)}")
-                        logger.error(f"Validation failed for {result.image_path.name}: {e}")
-                    except Exception as e:
-                        save_errors.append(f"YAML save: {str(e)}")
-                        logger.error(f"Failed to save YAML sidecar for {result.image_path.name}: {e}")
+            # Display the response
+            self.response_preview.setPlainText(result.response)
+            
+            # Update performance metrics
+            self._update_performance_metrics(result)
+            
+            # Track batch averages
+            if result.eval_count:
+                self.batch_metrics_count += 1
+                self.batch_total_tokens += result.eval_count or 0
+                self.batch_total_prompt_tokens += result.prompt_eval_count or 0
+                self.batch_total_duration += result.total_duration or 0
+                self.batch_total_eval_duration += result.eval_duration or 0
+                self.batch_total_load_duration += result.load_duration or 0
                 
-                # Save .txt file (for backward compatibility)
+                # Update average displays (coalesced)
+                if not self._batch_averages_timer.isActive():
+                    self._batch_averages_timer.start()
+        else:
+            error_msg = result.error or "Unknown error"
+            logger.error(f"Batch item failed: {result.image_path.name} - {error_msg}")
+            self.batch_failed_items.append((result.image_path, result.image_path.name, error_msg))
+            self._update_status(f"❌ Failed: {result.image_path.name} - {error_msg}")
+    
+    def _save_batch_result(
+        self,
+        result: AnalysisResult,
+        output_dir: Optional[Path],
+        write_yaml: bool,
+        write_metadata: bool,
+        overwrite: bool,
+    ) -> None:
+        """
+        Save a batch result to disk (runs on the I/O pool).
+        
+        Emits _batch_save_finished with what was saved and any errors.
+        
+        Args:
+            result: Successful analysis result to save.
+            output_dir: Directory for the .txt file (None = next to the image).
+            write_yaml: Whether to write the YAML sidecar.
+            write_metadata: Whether to write the description into the image.
+            overwrite: Whether to overwrite existing output files.
+        """
+        saved_files = []
+        save_errors = []
+        
+        try:
+            # Determine output path
+            txt_path = self._txt_output_path(result.image_path, output_dir)
+            
+            # Save YAML sidecar (PhotoPrism compatible)
+            if write_yaml:
                 try:
-                    txt_path = self.analyzer.save_result(result, Path(str(base_output) + ".txt"), overwrite=self.overwrite_checkbox.isChecked())
-                    saved_files.append("TXT")
+                    self.analyzer.save_yaml_sidecar(result, result.image_path, overwrite=overwrite)
+                    saved_files.append("YAML")
                 except ValueError as e:
                     # Validation error - this is critical
-                    save_errors.append(f"TXT validation: {str(e)}")
+                    save_errors.append(f"YAML validation: {str(e)}")
                     logger.error(f"Validation failed for {result.image_path.name}: {e}")
                 except Exception as e:
-                    save_errors.append(f"TXT save: {str(e)}")
-                    logger.error(f"Failed to save text file for {result.image_path.name}: {e}")
-                
-                # Optionally write to image metadata
-                if self.write_metadata_checkbox.isVisible() and self.write_metadata_checkbox.isChecked():
-                    try:
-                        if self.analyzer.write_to_image_metadata(result, result.image_path):
-                            saved_files.append("EXIF")
-                        else:
-                            logger.warning(f"Failed to write metadata for {result.image_path.name}")
-                    except Exception as e:
-                        save_errors.append(f"EXIF: {str(e)}")
-                        logger.error(f"Failed to write image metadata for {result.image_path.name}: {e}")
-                
-                # If no files were saved successfully, treat this as a failure
-                if not saved_files:
-                    error_msg = "All save operations failed: " + "; ".join(save_errors)
-                    logger.error(f"Complete save failure for {result.image_path.name}: {error_msg}")
-                    self.batch_failed_items.append((result.image_path, result.image_path.name, error_msg))
-                    self._update_status(f"❌ Failed to save {result.image_path.name}: {error_msg}")
-                else:
-                    logger.info(f"Batch item complete: {result.image_path.name} -> Saved: {', '.join(saved_files)}")
-                    if save_errors:
-                        # Some saves failed but at least one succeeded
-                        logger.warning(f"Partial save for {result.image_path.name} - Errors: {'; '.join(save_errors)}")
-                
-                # Display the response
-                self.response_preview.setPlainText(result.response)
-                
-                # Update performance metrics
-                self._update_performance_metrics(result)
-                
-                # Track batch averages
-                if result.eval_count:
-                    self.batch_metrics_count += 1
-                    self.batch_total_tokens += result.eval_count or 0
-                    self.batch_total_prompt_tokens += result.prompt_eval_count or 0
-                    self.batch_total_duration += result.total_duration or 0
-                    self.batch_total_eval_duration += result.eval_duration or 0
-                    self.batch_total_load_duration += result.load_duration or 0
-                    
-                    # Update average displays
-                    self._update_batch_average_metrics()
-                    
+                    save_errors.append(f"YAML save: {str(e)}")
+                    logger.error(f"Failed to save YAML sidecar for {result.image_path.name}: {e}")
+            
+            # Save .txt file (for backward compatibility)
+            try:
+                self.analyzer.save_result(result, txt_path, overwrite=overwrite)
+                saved_files.append("TXT")
+            except ValueError as e:
+                # Validation error - this is critical
+                save_errors.append(f"TXT validation: {str(e)}")
+                logger.error(f"Validation failed for {result.image_path.name}: {e}")
             except Exception as e:
-                error_msg = f"Save error: {str(e)}"
-                logger.error(f"Failed to save batch result for {result.image_path.name}: {e}")
-                self.batch_failed_items.append((result.image_path, result.image_path.name, error_msg))
-                self._update_status(f"⚠️ Error saving {result.image_path.name}: {error_msg}")
+                save_errors.append(f"TXT save: {str(e)}")
+                logger.error(f"Failed to save text file for {result.image_path.name}: {e}")
+            
+            # Optionally write to image metadata
+            if write_metadata:
+                try:
+                    if self.analyzer.write_to_image_metadata(result, result.image_path):
+                        saved_files.append("EXIF")
+                    else:
+                        logger.warning(f"Failed to write metadata for {result.image_path.name}")
+                except Exception as e:
+                    save_errors.append(f"EXIF: {str(e)}")
+                    logger.error(f"Failed to write image metadata for {result.image_path.name}: {e}")
+        
+        except Exception as e:
+            logger.error(f"Failed to save batch result for {result.image_path.name}: {e}")
+            save_errors.append(f"Save error: {str(e)}")
+        
+        self._batch_save_finished.emit(result.image_path, saved_files, save_errors)
+    
+    def _on_batch_save_finished(self, image_path: Path, saved_files: List[str], save_errors: List[str]) -> None:
+        """Record the outcome of _save_batch_result on the GUI thread."""
+        self._batch_saves_pending -= 1
+        
+        # If no files were saved successfully, treat this as a failure
+        if not saved_files:
+            error_msg = "All save operations failed: " + "; ".join(save_errors)
+            logger.error(f"Complete save failure for {image_path.name}: {error_msg}")
+            self.batch_failed_items.append((image_path, image_path.name, error_msg))
+            self._update_status(f"❌ Failed to save {image_path.name}: {error_msg}")
         else:
-            error_msg = result.error or "Unknown error"
-            logger.error(f"Batch item failed: {result.image_path.name} - {error_msg}")
-            self.batch_failed_items.append((result.image_path, result.image_path.name, error_msg))
-            self._update_status(f"❌ Failed: {result.image_path.name} - {error_msg}")
+            logger.info(f"Batch item complete: {image_path.name} -> Saved: {', '.join(saved_files)}")
+            if save_errors:
+                # Some saves failed but at least one succeeded
+                logger.warning(f"Partial save for {image_path.name} - Errors: {'; '.join(save_errors)}")
+        
+        # The batch ended while saves were outstanding; show its summary now
+        if self._batch_saves_pending == 0 and self._batch_finish_pending is not None:
+            processed, successful = self._batch_finish_pending
+            self._batch_finish_pending = None
+            self._on_batch_finished(processed, successful)
     
     def _update_batch_progress_with_eta(self, completed: int, total: int) -> None:
         """Update progress bar with completion count and estimated time remaining.
@@ -1178,11 +1643,6 @@ class MainWindow(QMainWindow):
             
             self.progress_bar.setFormat(f"{completed}/{total} - %p% - ETA: {eta_str}")
     
-    def _on_batch_progress(self, percentage: int) -> None:
-        """Handle batch progress update."""
-        # Progress is already shown via item_started
-        pass
-    
     def _on_batch_error(self, error: str) -> None:
         """Handle batch analysis error."""
         logger.error(f"Batch analysis error: {error}")
@@ -1194,6 +1654,23 @@ class MainWindow(QMainWindow):
     
     def _on_batch_finished(self, processed: int, successful: int) -> None:
         """Handle batch analysis completion."""
+        self._close_retired_analyzers(finished=self.batch_worker)
+        
+        # Drop any throttled item update so it can't overwrite the summary
+        self._batch_item_timer.stop()
+        self._latest_batch_item = None
+        
+        # Show the final averages now rather than when the timer fires
+        if self._batch_averages_timer.isActive():
+            self._batch_averages_timer.stop()
+            self._update_batch_average_metrics()
+        
+        # Save failures count towards the summary, so wait for pending saves
+        if self._batch_saves_pending > 0:
+            self._batch_finish_pending = (processed, successful)
+            self._update_status("Saving results...")
+            return
+        
         # Re-enable UI
         self.analyze_button.setEnabled(bool(self.image_viewer.current_image))
         self.import_button.setEnabled(True)
@@ -1210,39 +1687,41 @@ class MainWindow(QMainWindow):
         # Show summary
         failed = processed - successful
         
+        parts: List[str] = []
         if was_stopped:
-            summary = f"Batch analysis stopped!\n\n"
-            summary += f"Processed: {processed} of {self.batch_total_count} images\n"
+            parts.append("Batch analysis stopped!\n\n")
+            parts.append(f"Processed: {processed} of {self.batch_total_count} images\n")
         else:
-            summary = f"Batch analysis complete!\n\n"
-            summary += f"Total images: {processed}\n"
+            parts.append("Batch analysis complete!\n\n")
+            parts.append(f"Total images: {processed}\n")
         
-        summary += f"✓ Successful: {successful}\n"
+        parts.append(f"✓ Successful: {successful}\n")
         
         if failed > 0:
-            summary += f"✗ Failed: {failed}\n"
+            parts.append(f"✗ Failed: {failed}\n")
             
             # Add details about failed items
             if self.batch_failed_items:
-                summary += f"\n❌ Failed items:\n"
+                parts.append("\n❌ Failed items:\n")
                 for image_path, filename, error_msg in self.batch_failed_items[:5]:  # Show first 5 errors
                     # Truncate long error messages
                     short_error = error_msg[:60] + "..." if len(error_msg) > 60 else error_msg
-                    summary += f"  • {filename}: {short_error}\n"
+                    parts.append(f"  • {filename}: {short_error}\n")
                 
                 if len(self.batch_failed_items) > 5:
-                    summary += f"  ... and {len(self.batch_failed_items) - 5} more\n"
+                    parts.append(f"  ... and {len(self.batch_failed_items) - 5} more\n")
         
         if was_stopped:
-            summary += f"⏸️ Stopped: {self.batch_total_count - processed} not processed\n"
+            parts.append(f"⏸️ Stopped: {self.batch_total_count - processed} not processed\n")
         
         # Add file format details based on checkbox states
-        summary += f"\n📄 Results saved for each image:\n"
-        if self.write_yaml_checkbox.isVisible() and self.write_yaml_checkbox.isChecked():
-            summary += f"  • PhotoPrism YAML sidecar (.yml)\n"
-        summary += f"  • Text file (.txt) for backward compatibility\n"
-        if self.write_metadata_checkbox.isVisible() and self.write_metadata_checkbox.isChecked():
-            summary += f"  • EXIF/IPTC metadata embedded in image\n"
+        parts.append("\n📄 Results saved for each image:\n")
+        if self._batch_write_yaml:
+            parts.append("  • PhotoPrism YAML sidecar (.yml)\n")
+        parts.append("  • Text file (.txt) for backward compatibility\n")
+        if self._batch_write_exif:
+            parts.append("  • EXIF/IPTC metadata embedded in image\n")
+        summary = "".join(parts)
         
         if was_stopped:
             self._update_status(f"⏸️ Batch stopped: {successful}/{processed} successful")
@@ -1312,14 +1791,15 @@ class MainWindow(QMainWindow):
         self.batch_worker = BatchAnalysisWorker(
             failed_paths,
             prompt,
-            self.analyzer
+            self.analyzer,
+            max_workers=self.config.batch_concurrency,
+            executor=self._get_batch_executor(),
         )
         
         self.batch_worker.started.connect(self._on_batch_started)
         self.batch_worker.item_started.connect(self._on_batch_item_started)
-        self.batch_worker.item_finished.connect(self._on_batch_item_finished)
+        self.batch_worker.items_batch_finished.connect(self._on_batch_items_finished)
         self.batch_worker.item_retry.connect(self._on_batch_item_retry)
-        self.batch_worker.progress.connect(self._on_batch_progress)
         self.batch_worker.error.connect(self._on_batch_error)
         self.batch_worker.finished.connect(self._on_batch_finished)
         
@@ -1329,9 +1809,16 @@ class MainWindow(QMainWindow):
         """Cancel the current analysis operation."""
         # Check if single image analysis is running
         if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.terminate()
-            self.current_worker.wait()
+            # The worker drops the request at its next streamed chunk; its
+            # remaining signals are ignored so the UI is free straight away
+            self.current_worker.blockSignals(True)
+            self.current_worker.cancel()
+            self._cancelled_workers = [
+                worker for worker in self._cancelled_workers if worker.isRunning()
+            ]
+            self._cancelled_workers.append(self.current_worker)
             self.current_worker = None
+            self._close_retired_analyzers()
             
             # Re-enable UI
             self.analyze_button.setEnabled(bool(self.image_viewer.current_image))
@@ -1393,21 +1880,14 @@ class MainWindow(QMainWindow):
             # Sync checkbox state with config
             self.overwrite_checkbox.setChecked(self.config.overwrite_existing_files)
             
-            # Update analyzer  
-            old_model = self.config.ollama_model
+            # Update analyzer (this also refreshes the model selector)
             self._update_analyzer()
             
-            # If model changed, update the selector
-            if old_model != self.config.ollama_model:
-                self._populate_model_list()
-            
             self._update_status("Settings saved")
             logger.info("Settings updated")
     
     def _show_about(self) -> None:
         """Show the about dialog."""
-        from ollama_image_analyzer import __version__
-        
         QMessageBox.about(
             self,
             "About Ollama Image Analyzer",
@@ -1445,8 +1925,30 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
             
-            self.current_worker.terminate()
-            self.current_worker.wait()
+            self.current_worker.blockSignals(True)
+            self.current_worker.cancel()
+            self._cancelled_workers.append(self.current_worker)
+        
+        # Cancelled workers stop at their next chunk; only a thread still
+        # stuck waiting on an unresponsive server is killed
+        threads: List[QThread] = list(self._cancelled_workers)
+        if self._connection_probe is not None:
+            threads.append(self._connection_probe)
+        deadline = time.monotonic() + self.SHUTDOWN_WAIT_SECONDS
+        for thread in threads:
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            if not thread.wait(remaining_ms):
+                logger.warning("Background thread did not stop in time; terminating it")
+                thread.terminate()
+                thread.wait()
+        self._close_retired_analyzers()
+        
+        if self.batch_executor is not None:
+            self.batch_executor.shutdown(wait=False, cancel_futures=True)
+        # Let pending result writes finish so no output file is left half-written
+        self._io_pool.shutdown(wait=True)
+        if self.result_cache is not None:
+            self.result_cache.close()
         
         event.accept()
 
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Optional
 
 from platformdirs import user_data_dir
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -180,53 +180,50 @@ class PromptEditor(QWidget):
                         bundled_prompts_dir = test_dir
                         break
             
-            # Block signals to prevent triggering on_preset_selected
-            self.preset_combo.blockSignals(True)
+            # Block signals to prevent triggering on_preset_selected (restored
+            # even if collecting the presets fails)
+            with QSignalBlocker(self.preset_combo):
+                # Clear and repopulate
+                self.preset_combo.clear()
             
-            # Clear and repopulate
-            self.preset_combo.clear()
+                # Collect presets from both locations
+                preset_files = []
             
-            # Collect presets from both locations
-            preset_files = []
+                # Add bundled presets (built-in, read-only)
+                if bundled_prompts_dir.exists():
+                    preset_files.extend(sorted(bundled_prompts_dir.glob("*.txt")))
             
-            # Add bundled presets (built-in, read-only)
-            if bundled_prompts_dir.exists():
-                preset_files.extend(sorted(bundled_prompts_dir.glob("*.txt")))
+                # Add user presets (custom, writable)
+                if self._user_presets_dir.exists():
+                    user_preset_files = sorted(self._user_presets_dir.glob("*.txt"))
+                    # Mark user presets with their full path to distinguish them
+                    preset_files.extend(user_preset_files)
             
-            # Add user presets (custom, writable)
-            if self._user_presets_dir.exists():
-                user_preset_files = sorted(self._user_presets_dir.glob("*.txt"))
-                # Mark user presets with their full path to distinguish them
-                preset_files.extend(user_preset_files)
+                # Remove duplicates (prefer user presets over bundled)
+                seen_names = set()
+                unique_presets = []
+                for preset_file in reversed(preset_files):  # Reverse so user presets are checked first
+                    stem = preset_file.stem
+                    if stem not in seen_names:
+                        seen_names.add(stem)
+                        unique_presets.append(preset_file)
             
-            # Remove duplicates (prefer user presets over bundled)
-            seen_names = set()
-            unique_presets = []
-            for preset_file in reversed(preset_files):  # Reverse so user presets are checked first
-                stem = preset_file.stem
-                if stem not in seen_names:
-                    seen_names.add(stem)
-                    unique_presets.append(preset_file)
+                unique_presets.reverse()  # Restore original order
             
-            unique_presets.reverse()  # Restore original order
-            
-            for preset_file in unique_presets:
-                # Skip AI Toolkit variant files (they're accessed via Model Type dropdown)
-                # Keep ai_toolkit.txt, but skip ai_toolkit_flux.txt, ai_toolkit_sdxl.txt, etc.
-                if preset_file.stem.startswith("ai_toolkit_"):
-                    continue
+                for preset_file in unique_presets:
+                    # Skip AI Toolkit variant files (they're accessed via Model Type dropdown)
+                    # Keep ai_toolkit.txt, but skip ai_toolkit_flux.txt, ai_toolkit_sdxl.txt, etc.
+                    if preset_file.stem.startswith("ai_toolkit_"):
+                        continue
                 
-                # Use filename without extension as display name
-                display_name = preset_file.stem.replace("_", " ").title()
+                    # Use filename without extension as display name
+                    display_name = preset_file.stem.replace("_", " ").title()
                 
-                # Add indicator for user presets
-                if preset_file.parent == self._user_presets_dir:
-                    display_name += " ★"  # Star to indicate custom preset
+                    # Add indicator for user presets
+                    if preset_file.parent == self._user_presets_dir:
+                        display_name += " ★"  # Star to indicate custom preset
                 
-                self.preset_combo.addItem(display_name, preset_file)
-            
-            # Restore signals
-            self.preset_combo.blockSignals(False)
+                    self.preset_combo.addItem(display_name, preset_file)
             
             # Update selection to match current preset
             self._update_preset_selection()
@@ -245,9 +242,8 @@ class PromptEditor(QWidget):
         for i in range(self.preset_combo.count()):
             preset_path = self.preset_combo.itemData(i)
             if preset_path and Path(preset_path) == self._current_preset_path:
-                self.preset_combo.blockSignals(True)
-                self.preset_combo.setCurrentIndex(i)
-                self.preset_combo.blockSignals(False)
+                with QSignalBlocker(self.preset_combo):
+                    self.preset_combo.setCurrentIndex(i)
                 break
     
     def _on_preset_selected(self, index: int) -> None:
@@ -471,15 +467,13 @@ class PromptEditor(QWidget):
                 updated_prompt = self._base_prompt
             
             # Block signals to prevent recursion
-            self.prompt_edit.blockSignals(True)
-            self.prompt_edit.setPlainText(updated_prompt)
-            self.prompt_edit.blockSignals(False)
+            with QSignalBlocker(self.prompt_edit):
+                self.prompt_edit.setPlainText(updated_prompt)
             self._update_char_count()
         elif self._current_preset_path and self._current_preset_path.stem != "ai_toolkit":
             # For other presets without triggers, just use the base prompt
-            self.prompt_edit.blockSignals(True)
-            self.prompt_edit.setPlainText(self._base_prompt)
-            self.prompt_edit.blockSignals(False)
+            with QSignalBlocker(self.prompt_edit):
+                self.prompt_edit.setPlainText(self._base_prompt)
             self._update_char_count()
     
     def _update_char_count(self) -> None:
@@ -566,9 +560,8 @@ class PromptEditor(QWidget):
             # If trigger word is set and prompt contains [trigger] placeholder, apply it
             if trigger_word and "[trigger]" in current_text:
                 updated_text = current_text.replace("[trigger]", trigger_word)
-                self.prompt_edit.blockSignals(True)
-                self.prompt_edit.setPlainText(updated_text)
-                self.prompt_edit.blockSignals(False)
+                with QSignalBlocker(self.prompt_edit):
+                    self.prompt_edit.setPlainText(updated_text)
                 self._update_char_count()
                 logger.debug(f"Applied trigger replacement: '{trigger_word}'")
             # If no [trigger] placeholder but we have a trigger word, check if it needs updating
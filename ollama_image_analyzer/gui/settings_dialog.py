@@ -20,7 +20,7 @@ from PySide6.QtWidgets import (
     QSpinBox,
 )
 
-from ollama_image_analyzer.core import Config, OllamaAnalyzer
+from ollama_image_analyzer.core import Config, OllamaAnalyzer, ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +81,30 @@ class SettingsDialog(QDialog):
         self.timeout_spin.setSuffix(" seconds")
         ollama_layout.addRow("Timeout:", self.timeout_spin)
         
+        # Batch concurrency
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setMinimum(1)
+        self.concurrency_spin.setMaximum(32)
+        self.concurrency_spin.setSuffix(" images")
+        self.concurrency_spin.setToolTip(
+            "Number of images analyzed at once during batch analysis.\n"
+            "Set this to the server's OLLAMA_NUM_PARALLEL for best throughput."
+        )
+        ollama_layout.addRow("Batch Concurrency:", self.concurrency_spin)
+        
+        # Generation threads
+        self.num_thread_spin = QSpinBox()
+        self.num_thread_spin.setMinimum(0)
+        self.num_thread_spin.setMaximum(256)
+        self.num_thread_spin.setSuffix(" threads")
+        self.num_thread_spin.setSpecialValueText("Server default")
+        self.num_thread_spin.setToolTip(
+            "CPU threads Ollama uses for generation (num_thread).\n"
+            "Ollama uses about half the cores by default; setting this to the\n"
+            "number of physical cores can speed up CPU inference."
+        )
+        ollama_layout.addRow("CPU Threads:", self.num_thread_spin)
+        
         layout.addWidget(ollama_group)
         
         # Output settings group
@@ -109,6 +133,25 @@ class SettingsDialog(QDialog):
         
         layout.addWidget(output_group)
         
+        # Result cache group
+        cache_group = QGroupBox("Result Cache")
+        cache_layout = QHBoxLayout(cache_group)
+        
+        self.cache_checkbox = QCheckBox("Reuse results for unchanged images")
+        self.cache_checkbox.setToolTip(
+            "When enabled, images already analyzed with the same prompt and model\n"
+            "reuse the stored result: batch analysis skips them, and analyzing a\n"
+            "single image offers the stored result or a fresh analysis."
+        )
+        cache_layout.addWidget(self.cache_checkbox)
+        
+        self.clear_cache_button = QPushButton("Clear Cache")
+        self.clear_cache_button.setToolTip("Remove all stored results")
+        self.clear_cache_button.clicked.connect(self._clear_cache)
+        cache_layout.addWidget(self.clear_cache_button)
+        
+        layout.addWidget(cache_group)
+        
         # Test connection button
         self.test_button = QPushButton("🔌 Test Connection")
         self.test_button.setObjectName("primaryButton")
@@ -130,11 +173,46 @@ class SettingsDialog(QDialog):
         self.host_input.setText(self.config.ollama_host)
         self.model_combo.setCurrentText(self.config.ollama_model)
         self.timeout_spin.setValue(self.config.timeout_seconds)
+        self.concurrency_spin.setValue(self.config.batch_concurrency)
+        self.num_thread_spin.setValue(self.config.num_thread)
         
         if self.config.output_directory:
             self.output_dir_input.setText(self.config.output_directory)
         
         self.overwrite_checkbox.setChecked(self.config.overwrite_existing_files)
+        self.cache_checkbox.setChecked(self.config.cache_results)
+    
+    def _clear_cache(self) -> None:
+        """Remove all cached analysis results after confirmation."""
+        reply = QMessageBox.question(
+            self,
+            "Clear Cache?",
+            "Remove all cached analysis results?\n\n"
+            "The next batch will analyze every image again.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        cache_file = self.config.result_cache_file
+        if cache_file.exists():
+            try:
+                cache = ResultCache(cache_file)
+                try:
+                    cache.clear()
+                finally:
+                    cache.close()
+            except Exception as e:
+                logger.error(f"Failed to clear result cache: {e}")
+                QMessageBox.critical(
+                    self,
+                    "Error",
+                    f"Failed to clear the cache:\n{str(e)}"
+                )
+                return
+        
+        QMessageBox.information(self, "Cache Cleared", "Cached analysis results were removed.")
     
     def _browse_output_dir(self) -> None:
         """Browse for output directory."""
@@ -258,6 +336,9 @@ class SettingsDialog(QDialog):
             "ollama_host": self.host_input.text().strip() or "http://localhost:11434",
             "ollama_model": self.model_combo.currentText().strip() or "llava",
             "timeout_seconds": self.timeout_spin.value(),
+            "batch_concurrency": self.concurrency_spin.value(),
+            "num_thread": self.num_thread_spin.value(),
             "output_directory": self.output_dir_input.text().strip() or None,
             "overwrite_existing_files": self.overwrite_checkbox.isChecked(),
+            "cache_results": self.cache_checkbox.isChecked(),
         }
@@ -1,10 +1,12 @@
 """Background worker for non-blocking image analysis."""
 
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QThread, Signal
 
 from ollama_image_analyzer.core import OllamaAnalyzer, AnalysisResult
 
@@ -19,6 +21,11 @@ class AnalysisWorker(QThread):
     finished = Signal(AnalysisResult)
     progress = Signal(str)  # Progress message
     error = Signal(str)  # Error message
+    text_received = Signal(str)  # Response text streamed since the last emit
+
+    # Streamed text is forwarded at most this often (seconds), so a fast
+    # model doesn't queue one GUI update per token
+    TEXT_FLUSH_INTERVAL = 0.05
 
     def __init__(
         self,
@@ -26,6 +33,7 @@ class AnalysisWorker(QThread):
         prompt: str,
         analyzer: OllamaAnalyzer,
         parent: Optional[QThread] = None,
+        image_data: Optional[bytes] = None,
     ) -> None:
         """
         Initialize the analysis worker.
@@ -35,12 +43,25 @@ class AnalysisWorker(QThread):
             prompt: Analysis prompt.
             analyzer: OllamaAnalyzer instance.
             parent: Parent object.
+            image_data: Image contents already read by the caller (if None,
+                the file is read in the worker thread).
         """
         super().__init__(parent)
         
         self.image_path = image_path
         self.prompt = prompt
         self.analyzer = analyzer
+        self.image_data = image_data
+        self._cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """
+        Ask the analysis to stop.
+        
+        The request is abandoned at the next streamed chunk and the thread
+        exits without emitting error or finished.
+        """
+        self._cancel_event.set()
     
     def run(self) -> None:
         """Run the analysis in a background thread."""
@@ -50,11 +71,32 @@ class AnalysisWorker(QThread):
             logger.info(f"Starting analysis of {self.image_path.name}")
             self.progress.emit(f"Analyzing {self.image_path.name}...")
             
-            # Perform analysis
+            # Perform analysis, streaming the response text as it is generated
+            pending: List[str] = []
+            flush_at = 0.0
+            
+            def on_text(text: str) -> None:
+                nonlocal flush_at
+                pending.append(text)
+                now = time.monotonic()
+                if now >= flush_at:
+                    self.text_received.emit("".join(pending))
+                    pending.clear()
+                    flush_at = now + self.TEXT_FLUSH_INTERVAL
+            
             result = self.analyzer.analyze_image(
                 self.image_path,
-                self.prompt
+                self.prompt,
+                stream=True,
+                image_data=self.image_data,
+                cancel_event=self._cancel_event,
+                on_text=on_text,
             )
+            if self._cancel_event.is_set():
+                logger.info(f"Analysis of {self.image_path.name} cancelled")
+                return
+            if pending:
+                self.text_received.emit("".join(pending))
             
             if result.success:
                 logger.info(f"Analysis complete: {len(result.response)} chars")
@@ -80,3 +122,36 @@ class AnalysisWorker(QThread):
                 image_path=self.image_path
             )
             self.finished.emit(result)
+
+
+class ConnectionProbe(QThread):
+    """Background thread that checks the Ollama server and lists its models."""
+
+    # Signals
+    probed = Signal(str, bool, list)  # host, connected, model names
+
+    def __init__(self, analyzer: OllamaAnalyzer, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the connection probe.
+        
+        Args:
+            analyzer: OllamaAnalyzer instance to probe the server with.
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        
+        self.analyzer = analyzer
+    
+    def run(self) -> None:
+        """Query the server in a background thread."""
+        # Listing the models doubles as the connection test, so one
+        # round-trip answers both
+        try:
+            models = self.analyzer.list_models()
+        except Exception as e:
+            logger.error(f"Failed to connect to Ollama at {self.analyzer.host}: {e}")
+            self.probed.emit(self.analyzer.host, False, [])
+            return
+        
+        logger.info(f"Successfully connected to Ollama at {self.analyzer.host}")
+        self.probed.emit(self.analyzer.host, True, models)